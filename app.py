@@ -9,7 +9,10 @@ import mediapipe as mp
 import numpy as np
 import time
 import math
+import operator
 from collections import deque
+from itertools import chain
+import queue
 import threading
 
 # Import our MIDI device
@@ -21,7 +24,144 @@ except ImportError as e:
     print("Install required packages: pip install python-rtmidi mido")
     MIDI_AVAILABLE = False
 
+# Numba is optional; without it the JIT-decorated helpers run as plain Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _apply_rotation(knob_value, current_angle, previous_angle, knob_min, knob_max, knob_range, max_angle):
+    """Apply one frame of hand rotation to a knob. Returns (new_value, new_previous_angle)."""
+    delta_angle = current_angle - previous_angle
+
+    # Handle angle wraparound
+    if delta_angle > 180.0:
+        delta_angle -= 360.0
+    elif delta_angle < -180.0:
+        delta_angle += 360.0
+
+    # Sensitivity: max_angle degrees of rotation covers the full range
+    new_value = knob_value + delta_angle * (knob_range / max_angle)
+    return max(min(new_value, knob_max), knob_min), current_angle
+
+
+# [MCP, PIP, DIP, TIP] chains for thumb, index, middle, ring, pinky
+_FINGER_CHAINS = np.array([
+    [1, 2, 3, 4],
+    [5, 6, 7, 8],
+    [9, 10, 11, 12],
+    [13, 14, 15, 16],
+    [17, 18, 19, 20]
+])
+_FINGER_CHAINS.flags.writeable = False
+
+# Hand skeleton as (M, 2) landmark index pairs (same topology as mp.solutions.hands.HAND_CONNECTIONS)
+_HAND_CONNECTIONS = np.array([
+    (0, 1), (1, 2), (2, 3), (3, 4),          # Thumb
+    (0, 5), (5, 6), (6, 7), (7, 8),          # Index
+    (5, 9), (9, 10), (10, 11), (11, 12),     # Middle
+    (9, 13), (13, 14), (14, 15), (15, 16),   # Ring
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20)  # Pinky + palm
+], dtype=np.int32)
+_HAND_CONNECTIONS.flags.writeable = False
+
+def _disk_offsets(radius):
+    """(K, 2) pixel offsets (x, y) covering a filled cv2.circle of the given radius"""
+    stamp = np.zeros((2 * radius + 1, 2 * radius + 1), dtype=np.uint8)
+    cv2.circle(stamp, (radius, radius), radius, 255, -1)
+    return np.argwhere(stamp)[:, ::-1] - radius
+
+
+# Landmark dot footprint, rasterized by cv2.circle itself so scattered dots match it pixel for pixel
+_DOT_OFFSETS = _disk_offsets(4)
+_DOT_OFFSETS.flags.writeable = False
+
+# (x, y, z) of a MediaPipe landmark in one call
+_LANDMARK_XYZ = operator.attrgetter('x', 'y', 'z')
+
+# Landmark index sets used per frame (hoisted so no per-call list allocations)
+_REQUIRED_LANDMARKS = np.array([0, 6, 8])  # Wrist, Index PIP, Index Tip
+_REQUIRED_LANDMARKS.flags.writeable = False
+_THUMB_INDICES = (0, 1, 2, 3, 4)
+_OTHER_INDICES = tuple(range(5, 21))
+_KNUCKLE_INDICES = (5, 9, 13, 17)
+_KNOB_NAMES = frozenset(('filter', 'low', 'mid', 'high'))
+
+
+def _landmark_array(landmarks):
+    """(21, 3) landmark array; MediaPipe landmark lists are converted once, arrays pass through"""
+    if isinstance(landmarks, np.ndarray):
+        return landmarks
+    return np.array([[lm.x, lm.y, lm.z] for lm in landmarks])
+
+
+def _in_frame(lms):
+    """Bool mask of landmarks whose normalized (x, y) lie inside the frame"""
+    xy = lms[:, :2]
+    return ((xy >= 0) & (xy <= 1)).all(axis=1)
+
+
+@njit(cache=True, fastmath=True)
+def _extended_finger_mask(lms, chains, angle_threshold):
+    """Curvature + radial extension test on a (21, 3) landmark array. Bit i set if chains[i] is extended."""
+    wx, wy, wz = lms[0, 0], lms[0, 1], lms[0, 2]
+    palm_scale = math.sqrt((lms[5, 0] - wx) ** 2 + (lms[5, 1] - wy) ** 2 + (lms[5, 2] - wz) ** 2)
+    if palm_scale < 0.01:
+        return 0
+    margin = 0.03 * palm_scale
+
+    mask = 0
+    for f in range(chains.shape[0]):
+        # Bend angles between consecutive segments MCP->PIP->DIP->TIP
+        curvature = 0.0
+        for j in range(2):
+            a, b, c = chains[f, j], chains[f, j + 1], chains[f, j + 2]
+            ax, ay, az = lms[b, 0] - lms[a, 0], lms[b, 1] - lms[a, 1], lms[b, 2] - lms[a, 2]
+            bx, by, bz = lms[c, 0] - lms[b, 0], lms[c, 1] - lms[b, 1], lms[c, 2] - lms[b, 2]
+            na = math.sqrt(ax * ax + ay * ay + az * az)
+            nb = math.sqrt(bx * bx + by * by + bz * bz)
+            cos_ab = 1.0
+            if na >= 1e-8 and nb >= 1e-8:
+                cos_ab = max(-1.0, min(1.0, (ax * bx + ay * by + az * bz) / (na * nb)))
+            curvature += math.degrees(math.acos(cos_ab))
+        if curvature >= angle_threshold:
+            continue
+
+        # Radial monotonicity with margin: r_mcp + margin < r_pip < r_dip < r_tip - margin/2
+        k0, k1, k2, k3 = chains[f, 0], chains[f, 1], chains[f, 2], chains[f, 3]
+        r0 = math.sqrt((lms[k0, 0] - wx) ** 2 + (lms[k0, 1] - wy) ** 2 + (lms[k0, 2] - wz) ** 2)
+        r1 = math.sqrt((lms[k1, 0] - wx) ** 2 + (lms[k1, 1] - wy) ** 2 + (lms[k1, 2] - wz) ** 2)
+        r2 = math.sqrt((lms[k2, 0] - wx) ** 2 + (lms[k2, 1] - wy) ** 2 + (lms[k2, 2] - wz) ** 2)
+        r3 = math.sqrt((lms[k3, 0] - wx) ** 2 + (lms[k3, 1] - wy) ** 2 + (lms[k3, 2] - wz) ** 2)
+        if r0 + margin < r1 < r2 < r3 - margin / 2:
+            mask |= 1 << f
+    return mask
+
+
 class HandDetectorWithMIDI:
+    # Target knob by extended-finger mask (bit 3=index, 2=middle, 1=ring, 0=pinky)
+    _TARGET_BY_MASK = [None] * 16
+    _TARGET_BY_MASK[0b1000] = 'filter'  # 1 finger: index only
+    _TARGET_BY_MASK[0b1100] = 'low'     # 2 fingers: index + middle
+    _TARGET_BY_MASK[0b1110] = 'mid'     # 3 fingers: index + middle + ring
+    _TARGET_BY_MASK[0b1111] = 'high'    # 4 fingers: index + middle + ring + pinky
+    _TARGET_BY_MASK = tuple(_TARGET_BY_MASK)
+
+    # Per-landmark dot color (BGR): wrist yellow, thumb red, index green, middle blue, ring magenta, pinky cyan
+    _LANDMARK_COLORS = (((0, 255, 255),) + ((0, 0, 255),) * 4 + ((0, 255, 0),) * 4
+                        + ((255, 0, 0),) * 4 + ((255, 0, 255),) * 4 + ((255, 255, 0),) * 4)
+    # Color of every dot pixel, in landmark order (matches the rows of the _DOT_OFFSETS scatter)
+    _DOT_COLORS = np.repeat(np.array(_LANDMARK_COLORS, dtype=np.uint8), len(_DOT_OFFSETS), axis=0)
+    _DOT_COLORS.flags.writeable = False
+
     def __init__(self):
         # Initialize MediaPipe hands with optimized settings
         self.mp_hands = mp.solutions.hands
@@ -61,9 +201,30 @@ class HandDetectorWithMIDI:
             "Pinky_Tip"        # 20
         ]
         
+        # Per-hand result slots reused every frame (process_frame overwrites them in place).
+        # float64 keeps pixel coords identical to int(landmark.x * w); copy a slot to keep it past the next frame.
+        self._landmark_buf = np.zeros((2, 21, 3))  # max_num_hands
+        self._pixel_buf = np.zeros((2, 21, 2), dtype=np.int32)
+        self._hand_pool = [
+            {
+                'hand_index': hand_idx,
+                'landmarks': self._landmark_buf[hand_idx],
+                'pixels': self._pixel_buf[hand_idx]
+            }
+            for hand_idx in range(len(self._landmark_buf))
+        ]
+        self._pixel_scratch = np.zeros((21, 2))
+        
         # Performance tracking
         self.fps_history = deque(maxlen=30)
-        self.frame_times = deque(maxlen=5)
+        self.frame_times = deque(maxlen=5)  # process_frame durations in ns
+        # Running process_frame aggregates (Welford mean/variance, min/max) over the whole session
+        self._n_frames = 0
+        self._mean_ns = 0.0
+        self._m2_ns = 0.0
+        self._min_ns = 2**63 - 1
+        self._max_ns = 0
+        self._dropped_frames = 0  # camera frames replaced before the main loop picked them up
         
         # Display options
         self.show_console_output = False
@@ -80,6 +241,9 @@ class HandDetectorWithMIDI:
         self.knob_names = ['filter', 'low', 'mid', 'high']
 
         self.knob_max_angle = 155
+        # Warm up the JIT kernels so compilation doesn't land on the first gesture frame
+        _apply_rotation(1.0, 0.0, 0.0, 0.0, 4.0, 4.0, self.knob_max_angle)
+        _extended_finger_mask(np.zeros((21, 3)), _FINGER_CHAINS, 30.0)
         
         # Deck 2 mirrors (do not change original deck 1 state)
         self.knobs2 = {k: v['default'] for k, v in self.knob_params.items()}
@@ -146,6 +310,9 @@ class HandDetectorWithMIDI:
         # Deck 2 thumbs up tracking
         self.thumbs_up_detected2 = False
         self.previous_thumbs_up2 = False
+        # Debug-only thumbs up inspection data (filled when landmarks/console output is on)
+        self.last_landmark_pixels = []
+        self.debug_thumb_sets = None
         
         # Play/stop state with gesture clearing (per hand)
         self._play_state1 = False
@@ -165,10 +332,12 @@ class HandDetectorWithMIDI:
         self.midi_device = None
         self.midi_enabled = False
         self.midi_send_rate = 30  # Hz - limit MIDI message rate
-        self.last_midi_send_time = 0
+        # Ticks to keep sending after the last change so the device's per-control smoothing (0.8 EMA) converges
+        self.midi_settle_ticks = self.midi_send_rate
         self.midi_thread = None
         self.midi_queue = []
-        self.midi_lock = threading.Lock()
+        # Set by the main thread whenever a knob or volume value changes; midi_worker sleeps on it
+        self._midi_dirty = threading.Event()
         
         # Load EasyDJ logo for effects (and a white-tinted version)
         self.logo_img = None
@@ -194,6 +363,34 @@ class HandDetectorWithMIDI:
         except Exception:
             pass
         
+        # Reusable per-frame image buffers (allocated on first frame / size change)
+        self._flip_buf = None
+        self._rgb_buf = None
+        self._resize_buf = None
+        # Fixed-size thumbnail buffers for the duplicate-frame hash
+        self._thumb_bgr = np.empty((16, 16, 3), dtype=np.uint8)
+        self._thumb_gray = np.empty((16, 16), dtype=np.uint8)
+        # Last thumbnail hash and MediaPipe result for the duplicate-frame skip
+        self._last_frame_hash = None
+        self._last_results = None
+        # Offload the large-frame downscale + color conversion to OpenCL (T-API) if OpenCV already has it on;
+        # probed on the first oversized frame (None until then) and never switched on process-wide
+        self._use_opencl = None
+        
+        # Main loop state and key bindings (dispatched by waitKey code)
+        self._should_stop = False
+        self.frame_count = 0
+        self._last_final_frame = None
+        self._key_handlers = {
+            ord('q'): self._on_quit,
+            ord('c'): self._on_toggle_console,
+            ord('a'): self._on_toggle_landmarks,
+            ord('s'): self._on_save_frame,
+            ord('r'): self._on_reset_knobs,
+            ord('t'): self._on_midi_test,
+            ord('d'): self._on_toggle_midi_debug,
+        }
+        
         self.init_midi()
     
     def init_midi(self):
@@ -218,40 +415,42 @@ class HandDetectorWithMIDI:
             print(f"✗ MIDI initialization error: {e}")
     
     def midi_worker(self):
-        """Background thread for sending MIDI messages at controlled rate"""
+        """Background thread for sending MIDI messages at controlled rate, idle until values change"""
+        period = 1.0 / self.midi_send_rate
+        settle_ticks = self.midi_settle_ticks  # Send the initial state once on startup
         while self.midi_enabled:
             try:
-                current_time = time.time()
+                # Settled: block until the main thread reports a change (close_midi also wakes us)
+                if settle_ticks <= 0:
+                    self._midi_dirty.wait()
+                    if not self.midi_enabled:
+                        break
+                if self._midi_dirty.is_set():
+                    self._midi_dirty.clear()
+                    settle_ticks = self.midi_settle_ticks
+                settle_ticks -= 1
                 
-                # Check if it's time to send MIDI updates
-                if current_time - self.last_midi_send_time >= (1.0 / self.midi_send_rate):
-                    with self.midi_lock:
-                        if self.midi_device:
-                            # Send current knob values
-                            sent_count = self.midi_device.update_all_controls(
-                                self.knobs, 
-                                self.active_knob
-                            )
-                            # Send deck 2 knob values on Deck 2 (deck numbering 1/2)
-                            sent_count2 = self.midi_device.update_all_controls_on_channel(
-                                self.knobs2,
-                                self.active_knob2,
-                                2
-                            )
-                            # Send channel volumes (0..1) on both decks
-                            try:
-                                # Periodic: send current volumes
-                                self.midi_device.update_control_on_channel('volume', float(self.volume), deck=1)
-                                self.midi_device.update_control_on_channel('volume', float(self.volume2), deck=2)
-                            except Exception:
-                                pass
-                            
-                            if (sent_count > 0 or sent_count2 > 0) and self.show_console_output:
-                                print(f"MIDI: Sent deck1={sent_count} deck2={sent_count2} control updates")
+                # Snapshot shared state; dict.copy() is atomic under the GIL, so no lock with the main thread
+                knobs, active_knob = self.knobs.copy(), self.active_knob
+                knobs2, active_knob2 = self.knobs2.copy(), self.active_knob2
+                volume, volume2 = float(self.volume), float(self.volume2)
+                
+                if self.midi_device:
+                    # Send current knob values
+                    sent_count = self.midi_device.update_all_controls(knobs, active_knob)
+                    # Send deck 2 knob values on Deck 2 (deck numbering 1/2)
+                    sent_count2 = self.midi_device.update_all_controls_on_channel(knobs2, active_knob2, 2)
+                    # Send channel volumes (0..1) on both decks
+                    try:
+                        self.midi_device.update_control_on_channel('volume', volume, deck=1)
+                        self.midi_device.update_control_on_channel('volume', volume2, deck=2)
+                    except Exception:
+                        pass
                     
-                    self.last_midi_send_time = current_time
+                    if (sent_count > 0 or sent_count2 > 0) and self.show_console_output:
+                        print(f"MIDI: Sent deck1={sent_count} deck2={sent_count2} control updates")
                 
-                time.sleep(0.01)  # Small sleep to prevent busy waiting
+                time.sleep(period)  # Rate limit: at most midi_send_rate updates per second
                 
             except Exception as e:
                 if self.show_console_output:
@@ -261,14 +460,22 @@ class HandDetectorWithMIDI:
     def close_midi(self):
         """Clean up MIDI resources"""
         self.midi_enabled = False
-        if self.midi_device:
-            self.midi_device.close()
+        self._midi_dirty.set()  # Wake the worker so it sees midi_enabled and exits
         if self.midi_thread and self.midi_thread.is_alive():
             self.midi_thread.join(timeout=1.0)
+        if self.midi_device:
+            self.midi_device.close()
+    
+    @staticmethod
+    def _ensure_buffer(buf, like):
+        """Return buf if it matches like's shape and dtype, otherwise a new empty array"""
+        if buf is None or buf.shape != like.shape or buf.dtype != like.dtype:
+            return np.empty_like(like)
+        return buf
     
     def process_frame(self, frame):
         """Process frame with optimizations"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Reset thumbs up indicators at the start of each frame.
         # They will be turned on only if hands exist and gesture passes.
@@ -278,22 +485,52 @@ class HandDetectorWithMIDI:
         self.effect1_detected = False
         self.effect1_detected2 = False
         
-        # Resize frame for faster processing if needed
+        # Safety net for cameras that ignore the 1280x720 request in run(); dead in the common case.
+        # Nearest-neighbor is enough for MediaPipe's CNN input and runs before any color conversion
+        small = None
         height, width = frame.shape[:2]
         if width > 1280:
             scale = 1280 / width
             new_width = int(width * scale)
             new_height = int(height * scale)
-            frame = cv2.resize(frame, (new_width, new_height))
-        
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            if self._use_opencl is None:
+                self._use_opencl = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+            if self._use_opencl:
+                # Only the downscaled BGR frame comes back to host memory here; RGB waits for a cache miss
+                small = cv2.resize(cv2.UMat(frame), (new_width, new_height), interpolation=cv2.INTER_NEAREST)
+                frame = small.get()
+            else:
+                shape = (new_height, new_width) + frame.shape[2:]
+                if self._resize_buf is None or self._resize_buf.shape != shape:
+                    self._resize_buf = np.empty(shape, dtype=frame.dtype)
+                frame = cv2.resize(frame, (new_width, new_height), dst=self._resize_buf,
+                                   interpolation=cv2.INTER_NEAREST)
         
-        # Process the frame
-        results = self.hands.process(rgb_frame)
+        # Duplicate-frame check: an identical 16x16 grayscale thumbnail reuses the last MediaPipe result
+        cv2.resize(frame, (16, 16), dst=self._thumb_bgr, interpolation=cv2.INTER_AREA)
+        thumb = cv2.cvtColor(self._thumb_bgr, cv2.COLOR_BGR2GRAY, dst=self._thumb_gray)
+        frame_hash = hash(thumb.tobytes())
+        if frame_hash == self._last_frame_hash and self._last_results is not None:
+            results = self._last_results
+        else:
+            # Convert BGR to RGB (on the device for an OpenCL downscale, else into the reusable buffer)
+            if small is not None:
+                rgb_frame = cv2.cvtColor(small, cv2.COLOR_BGR2RGB).get()
+            else:
+                self._rgb_buf = self._ensure_buffer(self._rgb_buf, frame)
+                self._rgb_buf.flags.writeable = True
+                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+            
+            # Read-only input lets MediaPipe wrap the buffer instead of copying it
+            rgb_frame.flags.writeable = False
+            
+            # Process the frame
+            results = self.hands.process(rgb_frame)
+            self._last_frame_hash = frame_hash
+            self._last_results = results
         
-        # Extract landmark data
-        landmark_data = []
+        # Landmark data: pooled (21, 3) normalized and (21, 2) pixel arrays per hand
+        active_hands = 0
         
         # Reset per-frame volume gesture aggregation (per deck)
         volume1_updated_this_frame = False
@@ -304,53 +541,33 @@ class HandDetectorWithMIDI:
         self.volume2_distance_px = 0.0
         
         if results.multi_hand_landmarks:
-            for hand_idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                # Draw landmarks if enabled (guard with low confidence cases)
-                if self.show_all_landmarks:
-                    self.mp_draw.draw_landmarks(
-                        frame, 
-                        hand_landmarks, 
-                        self.mp_hands.HAND_CONNECTIONS
-                    )
-                
-                # Extract key landmarks
+            for hand_idx, hand_landmarks in enumerate(results.multi_hand_landmarks[:len(self._hand_pool)]):
+                # All landmarks as one (21, 3) array (normalized x, y, z) plus pixel coords in one multiply
+                hand_data = self._hand_pool[hand_idx]
+                lms = hand_data['landmarks']
+                pixels = hand_data['pixels']
                 h, w = frame.shape[:2]
-                hand_data = []
+                lms.reshape(-1)[:] = np.fromiter(
+                    chain.from_iterable(map(_LANDMARK_XYZ, hand_landmarks.landmark)),
+                    dtype=np.float64, count=63
+                )
+                np.multiply(lms[:, :2], (w, h), out=self._pixel_scratch)
+                np.copyto(pixels, self._pixel_scratch, casting='unsafe')
+                active_hands = hand_idx + 1
                 
-                for i, landmark_idx in enumerate(self.key_landmarks):
-                    landmark = hand_landmarks.landmark[landmark_idx]
-                    x = int(landmark.x * w)
-                    y = int(landmark.y * h)
-                    
-                    hand_data.append({
-                        'name': self.landmark_names[i],
-                        'x': x,
-                        'y': y,
-                        'z': landmark.z
-                    })
+                # Skeleton, color-coded dots and index labels are a debug view behind the 'a' toggle
+                if self.show_all_landmarks:
+                    # Every connection in one polylines call
+                    cv2.polylines(frame, pixels[_HAND_CONNECTIONS], False, (224, 224, 224), 2)
                     
-                    # Draw landmarks with color coding
-                    if i == 0:  # Wrist
-                        color = (0, 255, 255)  # Yellow
-                    elif 1 <= i <= 4:  # Thumb
-                        color = (0, 0, 255)    # Red
-                    elif 5 <= i <= 8:  # Index
-                        color = (0, 255, 0)    # Green
-                    elif 9 <= i <= 12:  # Middle
-                        color = (255, 0, 0)    # Blue
-                    elif 13 <= i <= 16:  # Ring
-                        color = (255, 0, 255)  # Magenta
-                    else:  # Pinky (17-20)
-                        color = (255, 255, 0)  # Cyan
+                    # All 21 dots as one scatter of the precomputed disk footprint (clipped to the frame)
+                    dots = (pixels[:, None, :] + _DOT_OFFSETS).reshape(-1, 2)
+                    inside = (dots >= 0).all(axis=1) & (dots[:, 0] < w) & (dots[:, 1] < h)
+                    frame[dots[inside, 1], dots[inside, 0]] = self._DOT_COLORS[inside]
                     
-                    cv2.circle(frame, (x, y), 4, color, -1)
-                    cv2.putText(frame, str(i), (x + 6, y - 6), 
-                              cv2.FONT_HERSHEY_SIMPLEX, 0.3, color, 1)
-                
-                landmark_data.append({
-                    'hand_index': hand_idx,
-                    'landmarks': hand_data
-                })
+                    for i, ((x, y), color) in enumerate(zip(pixels.tolist(), self._LANDMARK_COLORS)):
+                        cv2.putText(frame, str(i), (x + 6, y - 6), 
+                                  cv2.FONT_HERSHEY_SIMPLEX, 0.3, color, 1)
                 
                 # Determine handedness for this hand early (guarded)
                 try:
@@ -361,14 +578,11 @@ class HandDetectorWithMIDI:
                 # ---------------- Volume + Rockstar gesture detection (per deck) ----------------
                 try:
                     # Extended finger flags
-                    flags = self.get_extended_finger_flags(hand_landmarks.landmark)
+                    flags = self.get_extended_finger_flags(lms)
                     mrp_extended = flags.get('middle', False) and flags.get('ring', False) and flags.get('pinky', False)
 
                     # Thumb (4) and Index (8) pixel coords
-                    thumb_tip = hand_landmarks.landmark[4]
-                    index_tip = hand_landmarks.landmark[8]
-                    x4, y4 = int(thumb_tip.x * w), int(thumb_tip.y * h)
-                    x8, y8 = int(index_tip.x * w), int(index_tip.y * h)
+                    (x4, y4), (x8, y8) = pixels[[4, 8]].tolist()
                     dx = x4 - x8
                     dy = y4 - y8
                     dist_px = (dx*dx + dy*dy) ** 0.5
@@ -392,6 +606,7 @@ class HandDetectorWithMIDI:
                                         self.volume = 0.0
                                     elif self.volume > 1.0:
                                         self.volume = 1.0
+                                    self._midi_dirty.set()
                             volume1_updated_this_frame = True
                         elif raw_label == 'Right':
                             self.volume2_touching = True
@@ -409,6 +624,7 @@ class HandDetectorWithMIDI:
                                         self.volume2 = 0.0
                                     elif self.volume2 > 1.0:
                                         self.volume2 = 1.0
+                                    self._midi_dirty.set()
                             volume2_updated_this_frame = True
                     
                     # Rockstar gesture: ONLY index and pinky are extended
@@ -432,7 +648,7 @@ class HandDetectorWithMIDI:
                 # Flip deck mapping per request: map raw 'Left' → Deck 1, raw 'Right' → Deck 2
                 if raw_label == 'Left':
                     # Deck 1
-                    self.current_pointer_angle = self.update_knob_values_deck1(hand_landmarks.landmark)
+                    self.current_pointer_angle = self.update_knob_values_deck1(lms)
                     
                     current_thumbs_up = self.is_thumbs_up(hand_landmarks.landmark, raw_label)
                     if current_thumbs_up and not self.previous_thumbs_up:
@@ -449,7 +665,7 @@ class HandDetectorWithMIDI:
                     self.previous_effect1_detected = self.effect1_detected
                 elif raw_label == 'Right':
                     # Deck 2
-                    self.current_pointer_angle2 = self.update_knob_values_deck2(hand_landmarks.landmark)
+                    self.current_pointer_angle2 = self.update_knob_values_deck2(lms)
                     
                     current_thumbs_up2 = self.is_thumbs_up(hand_landmarks.landmark, raw_label)
                     if current_thumbs_up2 and not self.previous_thumbs_up2:
@@ -481,29 +697,25 @@ class HandDetectorWithMIDI:
             self.volume2_prev_y = None
             self.volume2_curr_y = None
         
-        # Track processing time
-        process_time = time.time() - start_time
-        self.frame_times.append(process_time)
+        # Track processing time (integer nanoseconds)
+        dt_ns = time.perf_counter_ns() - start_ns
+        self.frame_times.append(dt_ns)
+        self._n_frames += 1
+        delta = dt_ns - self._mean_ns
+        self._mean_ns += delta / self._n_frames
+        self._m2_ns += delta * (dt_ns - self._mean_ns)
+        if dt_ns < self._min_ns:
+            self._min_ns = dt_ns
+        if dt_ns > self._max_ns:
+            self._max_ns = dt_ns
         
-        return frame, landmark_data
+        # Slots are overwritten by the next process_frame call
+        return frame, self._hand_pool[:active_hands]
     
     def count_fingers(self, landmarks):
-        """Extended finger counting using colinearity and radial distance"""
+        """Extended finger counting using colinearity and radial distance (all four fingers at once)"""
         try:
-            
-            # Convert landmarks to numpy array
-            lms = np.array([[lm.x, lm.y, lm.z] for lm in landmarks])
-            
-            fingers_extended = 0
-            debug_info = []
-            
-            # Finger chain definitions: [MCP, PIP, DIP, TIP]
-            finger_chains = [
-                ("Index", [5, 6, 7, 8]),
-                ("Middle", [9, 10, 11, 12]),
-                ("Ring", [13, 14, 15, 16]),
-                ("Pinky", [17, 18, 19, 20])
-            ]
+            lms = _landmark_array(landmarks)
             
             # Calculate palm scale (wrist to index MCP distance)
             wrist = lms[0]
@@ -514,57 +726,39 @@ class HandDetectorWithMIDI:
                 self.finger_debug_count = 0
                 return 0
             
-            for finger_name, chain in finger_chains:
-                try:
-                    mcp, pip, dip, tip = [lms[i] for i in chain]
-                    
-                    # Check colinearity (straightness) using segment vectors
-                    s0 = pip - mcp    # MCP to PIP
-                    s1 = dip - pip    # PIP to DIP  
-                    s2 = tip - dip    # DIP to TIP
-                    
-                    def safe_cosine(a, b):
-                        na = np.linalg.norm(a)
-                        nb = np.linalg.norm(b)
-                        if na < 1e-8 or nb < 1e-8:
-                            return 1.0
-                        return np.clip(np.dot(a, b) / (na * nb), -1.0, 1.0)
-                    
-                    # Calculate curvature (total bend angle)
-                    cos01 = safe_cosine(s0, s1)
-                    cos12 = safe_cosine(s1, s2)
-                    
-                    bend_angle_01 = math.degrees(math.acos(np.clip(cos01, -1.0, 1.0)))
-                    bend_angle_12 = math.degrees(math.acos(np.clip(cos12, -1.0, 1.0)))
-                    total_curvature = bend_angle_01 + bend_angle_12
-                    
-                    # Check if finger is straight enough (curvature approach)
-                    angle_threshold = 35.0  # degrees
-                    is_straight = total_curvature < angle_threshold
-                    
-                    # Check radial monotonicity (tip farther from wrist than base)
-                    r_mcp = np.linalg.norm(mcp - wrist)
-                    r_pip = np.linalg.norm(pip - wrist)
-                    r_dip = np.linalg.norm(dip - wrist)
-                    r_tip = np.linalg.norm(tip - wrist)
-                    
-                    # Ensure distances increase along the finger with some tolerance
-                    margin = 0.03 * palm_scale
-                    is_monotonic = (r_mcp + margin < r_pip < r_dip < r_tip - margin/2)
-                    
-                    # Finger is extended if both conditions are met
-                    is_extended = is_straight and is_monotonic
-                    
-                    if is_extended:
-                        fingers_extended += 1
-                        debug_info.append(f"{finger_name}: EXTENDED (curve={total_curvature:.1f}°)")
-                    else:
-                        reason = "CURVED" if not is_straight else "NOT_MONOTONIC"
-                        debug_info.append(f"{finger_name}: {reason} (curve={total_curvature:.1f}°)")
-                        
-                except (IndexError, AttributeError) as e:
-                    debug_info.append(f"{finger_name}: ERROR")
-                    continue
+            # Index..pinky [MCP, PIP, DIP, TIP] chains as one (4, 4, 3) block
+            chains = lms[_FINGER_CHAINS[1:]]
+            
+            # Colinearity (straightness): bend angles between segments MCP->PIP->DIP->TIP
+            segs = np.diff(chains, axis=1)
+            seg_norms = np.linalg.norm(segs, axis=2)
+            dots = (segs[:, :-1] * segs[:, 1:]).sum(axis=2)
+            denom = seg_norms[:, :-1] * seg_norms[:, 1:]
+            degenerate = (seg_norms[:, :-1] < 1e-8) | (seg_norms[:, 1:] < 1e-8)
+            cos_bend = np.where(degenerate, 1.0, np.clip(dots / np.where(degenerate, 1.0, denom), -1.0, 1.0))
+            total_curvature = np.degrees(np.arccos(cos_bend)).sum(axis=1)
+            
+            # Check if finger is straight enough (curvature approach)
+            is_straight = total_curvature < 35.0  # degrees
+            
+            # Radial monotonicity (tip farther from wrist than base), with some tolerance
+            r = np.linalg.norm(chains - wrist, axis=2)
+            margin = 0.03 * palm_scale
+            is_monotonic = (r[:, 0] + margin < r[:, 1]) & (r[:, 1] < r[:, 2]) & (r[:, 2] < r[:, 3] - margin / 2)
+            
+            # Finger is extended if both conditions are met
+            is_extended = is_straight & is_monotonic
+            fingers_extended = int(is_extended.sum())
+            
+            debug_info = []
+            for finger_name, extended, straight, curve in zip(
+                    ("Index", "Middle", "Ring", "Pinky"), is_extended.tolist(), is_straight.tolist(),
+                    total_curvature.tolist()):
+                if extended:
+                    debug_info.append(f"{finger_name}: EXTENDED (curve={curve:.1f}°)")
+                else:
+                    reason = "CURVED" if not straight else "NOT_MONOTONIC"
+                    debug_info.append(f"{finger_name}: {reason} (curve={curve:.1f}°)")
             
             self.finger_debug_info = debug_info
             self.finger_debug_count = fingers_extended
@@ -580,69 +774,29 @@ class HandDetectorWithMIDI:
         """Return which fingers (Index, Middle, Ring, Pinky) are extended using curvature + radial tests."""
         flags = {'thumb': False, 'index': False, 'middle': False, 'ring': False, 'pinky': False}
         try:
-            lms = np.array([[lm.x, lm.y, lm.z] for lm in landmarks])
-            wrist = lms[0]
-            palm_scale = np.linalg.norm(lms[5] - wrist)
-            if palm_scale < 0.01:
-                return flags
-            finger_chains = [
-                ('thumb', [1, 2, 3, 4]),
-                ('index', [5, 6, 7, 8]),
-                ('middle', [9, 10, 11, 12]),
-                ('ring', [13, 14, 15, 16]),
-                ('pinky', [17, 18, 19, 20])
-            ]
-            for key, chain in finger_chains:
-                mcp, pip, dip, tip = [lms[i] for i in chain]
-                s0 = pip - mcp
-                s1 = dip - pip
-                s2 = tip - dip
-                def safe_cos(a, b):
-                    na = np.linalg.norm(a); nb = np.linalg.norm(b)
-                    if na < 1e-8 or nb < 1e-8:
-                        return 1.0
-                    return np.clip(np.dot(a, b) / (na * nb), -1.0, 1.0)
-                bend01 = math.degrees(math.acos(np.clip(safe_cos(s0, s1), -1.0, 1.0)))
-                bend12 = math.degrees(math.acos(np.clip(safe_cos(s1, s2), -1.0, 1.0)))
-                curvature = bend01 + bend12
-                angle_threshold = 30.0
-                is_straight = curvature < angle_threshold
-                r_mcp = np.linalg.norm(mcp - wrist)
-                r_pip = np.linalg.norm(pip - wrist)
-                r_dip = np.linalg.norm(dip - wrist)
-                r_tip = np.linalg.norm(tip - wrist)
-                margin = 0.03 * palm_scale
-                is_monotonic = (r_mcp + margin < r_pip < r_dip < r_tip - margin/2)
-                flags[key] = bool(is_straight and is_monotonic)
+            lms = _landmark_array(landmarks)
+            mask = _extended_finger_mask(lms, _FINGER_CHAINS, 30.0)
+            for bit, key in enumerate(('thumb', 'index', 'middle', 'ring', 'pinky')):
+                flags[key] = bool(mask >> bit & 1)
             return flags
         except Exception:
             return flags
     
-    def calculate_pointer_angle(self, landmarks):
-        """Calculate angle between wrist and pointer finger tip"""
+    def calculate_pointer_angle(self, landmarks, valid=None):
+        """Calculate angle between wrist and pointer finger tip (valid: optional precomputed _in_frame mask)"""
         try:
-            wrist = landmarks[0]
-            pointer_tip = landmarks[8]
-            
-            if (wrist.x < 0 or wrist.x > 1 or wrist.y < 0 or wrist.y > 1 or
-                pointer_tip.x < 0 or pointer_tip.x > 1 or pointer_tip.y < 0 or pointer_tip.y > 1):
+            lms = _landmark_array(landmarks)
+            if valid is None:
+                valid = _in_frame(lms)
+            if not (valid[0] and valid[8]):
                 return 0.0
             
-            dx = pointer_tip.x - wrist.x
-            dy = pointer_tip.y - wrist.y
-            
-            distance = (dx**2 + dy**2)**0.5
-            if distance < 0.01:
+            # Scalar math stays in Python floats; atan2 already lands in -180...180
+            dx, dy = (lms[8, :2] - lms[0, :2]).tolist()
+            if math.hypot(dx, dy) < 0.01:
                 return 0.0
             
-            angle = math.degrees(-math.atan2(dx, dy))
-            
-            while angle > 180:
-                angle -= 360
-            while angle < -180:
-                angle += 360
-                
-            return angle
+            return math.degrees(-math.atan2(dx, dy))
             
         except Exception as e:
             if self.show_console_output:
@@ -652,39 +806,31 @@ class HandDetectorWithMIDI:
     def update_knob_values_deck1(self, landmarks):
         """Update DJ knob values with MIDI output"""
         try:
-            if not landmarks or len(landmarks) < 21:
+            if landmarks is None or len(landmarks) < 21:
                 self.handle_detection_loss()
                 return 0.0
             
-            required_landmarks = [0, 6, 8]
-            for idx in required_landmarks:
-                if landmarks[idx].x < 0 or landmarks[idx].x > 1 or landmarks[idx].y < 0 or landmarks[idx].y > 1:
-                    self.handle_detection_loss()
-                    return 0.0
+            # Landmark array and in-frame mask, shared by every check below
+            lms = _landmark_array(landmarks)
+            valid = _in_frame(lms)
+            if not valid[_REQUIRED_LANDMARKS].all():
+                self.handle_detection_loss()
+                return 0.0
             
             # Determine which specific fingers are extended
-            ext_flags = self.get_extended_finger_flags(landmarks)
-            finger_count = int(ext_flags.get('index', False)) + int(ext_flags.get('middle', False)) + int(ext_flags.get('ring', False)) + int(ext_flags.get('pinky', False))
-            current_angle = self.calculate_pointer_angle(landmarks)
+            ext_flags = self.get_extended_finger_flags(lms)
+            finger_mask = (ext_flags['index'] << 3) | (ext_flags['middle'] << 2) | (ext_flags['ring'] << 1) | ext_flags['pinky']
+            finger_count = bin(finger_mask).count('1')
+            current_angle = self.calculate_pointer_angle(lms, valid)
             
             self.previous_finger_count = self.current_finger_count
             self.previous_active_knob = self.active_knob
             self.current_finger_count = finger_count
             
             # Determine target knob
-            # Determine target knob
-            target_knob = None
-
-            if ext_flags.get('index', False) and not ext_flags.get('middle', False) and not ext_flags.get('ring', False) and not ext_flags.get('pinky', False):
-                target_knob = 'filter'  # 1 finger: index only
-            elif ext_flags.get('index', False) and ext_flags.get('middle', False) and not ext_flags.get('ring', False) and not ext_flags.get('pinky', False):
-                target_knob = 'low'     # 2 fingers: index + middle
-            elif ext_flags.get('index', False) and ext_flags.get('middle', False) and ext_flags.get('ring', False) and not ext_flags.get('pinky', False):
-                target_knob = 'mid'     # 3 fingers: index + middle + ring
-            elif ext_flags.get('index', False) and ext_flags.get('middle', False) and ext_flags.get('ring', False) and ext_flags.get('pinky', False):
-                target_knob = 'high'    # 4 fingers: index + middle + ring + pinky
+            target_knob = self._TARGET_BY_MASK[finger_mask]
             
-            pointer_up = self.is_pointer_finger_up(landmarks)
+            pointer_up = self.is_pointer_finger_up(lms, valid)
             
             if pointer_up and target_knob:
                 self.stable_detection_count += 1
@@ -705,23 +851,12 @@ class HandDetectorWithMIDI:
                 
                 # Continue current gesture
                 elif self.active_knob == target_knob and self.gesture_active and self.previous_angle is not None:
-                    delta_angle = current_angle - self.previous_angle
-                    
-                    # Handle angle wraparound
-                    if delta_angle > 180:
-                        delta_angle -= 360
-                    elif delta_angle < -180:
-                        delta_angle += 360
-                    
                     params = self.knob_params[target_knob]
-                    # Sensitivity: 180 degrees of rotation covers the full range
-                    sensitivity = params['range'] / self.knob_max_angle
-                    scaled_delta = delta_angle * sensitivity
-
-                    new_value = self.knobs[target_knob] + scaled_delta
-                    self.knobs[target_knob] = max(params['min'], min(params['max'], new_value))
-                    
-                    self.previous_angle = current_angle
+                    self.knobs[target_knob], self.previous_angle = _apply_rotation(
+                        self.knobs[target_knob], current_angle, self.previous_angle,
+                        params['min'], params['max'], params['range'], self.knob_max_angle
+                    )
+                    self._midi_dirty.set()
             
             # End gesture when pointer goes down
             elif not pointer_up and self.gesture_active:
@@ -749,20 +884,17 @@ class HandDetectorWithMIDI:
             self.handle_detection_loss()
             return 0.0
     
-    def is_pointer_finger_up(self, landmarks):
-        """Check if pointer finger is up"""
+    def is_pointer_finger_up(self, landmarks, valid=None):
+        """Check if pointer finger is up (valid: optional precomputed _in_frame mask)"""
         try:
-            wrist = landmarks[0]
-            index_tip = landmarks[8]
-            index_mcp = landmarks[5]
-            
-            if (wrist.x < 0 or wrist.x > 1 or wrist.y < 0 or wrist.y > 1 or
-                index_tip.x < 0 or index_tip.x > 1 or index_tip.y < 0 or index_tip.y > 1 or
-                index_mcp.x < 0 or index_mcp.x > 1 or index_mcp.y < 0 or index_mcp.y > 1):
+            lms = _landmark_array(landmarks)
+            if valid is None:
+                valid = _in_frame(lms)
+            if not (valid[0] and valid[8] and valid[5]):
                 return False
             
-            tip_to_wrist = ((index_tip.x - wrist.x)**2 + (index_tip.y - wrist.y)**2)**0.5
-            mcp_to_wrist = ((index_mcp.x - wrist.x)**2 + (index_mcp.y - wrist.y)**2)**0.5
+            # Index tip and MCP distances from the wrist in one call
+            tip_to_wrist, mcp_to_wrist = np.hypot(*(lms[[8, 5], :2] - lms[0, :2]).T).tolist()
             
             return tip_to_wrist > mcp_to_wrist * 1.15
             
@@ -772,37 +904,30 @@ class HandDetectorWithMIDI:
     def update_knob_values_deck2(self, landmarks):
         """Duplicate of update_knob_values for Deck 2 (right hand), independent state"""
         try:
-            if not landmarks or len(landmarks) < 21:
+            if landmarks is None or len(landmarks) < 21:
                 # Do not affect deck 1 state here
                 return 0.0
             
-            required_landmarks = [0, 6, 8]
-            for idx in required_landmarks:
-                if landmarks[idx].x < 0 or landmarks[idx].x > 1 or landmarks[idx].y < 0 or landmarks[idx].y > 1:
-                    return 0.0
+            # Landmark array and in-frame mask, shared by every check below
+            lms = _landmark_array(landmarks)
+            valid = _in_frame(lms)
+            if not valid[_REQUIRED_LANDMARKS].all():
+                return 0.0
             
             # Determine which specific fingers are extended (deck 2)
-            ext_flags = self.get_extended_finger_flags(landmarks)
-            finger_count = int(ext_flags.get('index', False)) + int(ext_flags.get('middle', False)) + int(ext_flags.get('ring', False)) + int(ext_flags.get('pinky', False))
-            current_angle = self.calculate_pointer_angle(landmarks)
+            ext_flags = self.get_extended_finger_flags(lms)
+            finger_mask = (ext_flags['index'] << 3) | (ext_flags['middle'] << 2) | (ext_flags['ring'] << 1) | ext_flags['pinky']
+            finger_count = bin(finger_mask).count('1')
+            current_angle = self.calculate_pointer_angle(lms, valid)
             
             self.previous_finger_count2 = self.current_finger_count2
             self.current_finger_count2 = finger_count
             prev_active = self.active_knob2
             
             # Determine target knob
-            # Determine target knob
-            target_knob = None
-            if ext_flags.get('index', False) and not ext_flags.get('middle', False) and not ext_flags.get('ring', False) and not ext_flags.get('pinky', False):
-                target_knob = 'filter'  # 1 finger: index only
-            elif ext_flags.get('index', False) and ext_flags.get('middle', False) and not ext_flags.get('ring', False) and not ext_flags.get('pinky', False):
-                target_knob = 'low'     # 2 fingers: index + middle
-            elif ext_flags.get('index', False) and ext_flags.get('middle', False) and ext_flags.get('ring', False) and not ext_flags.get('pinky', False):
-                target_knob = 'mid'     # 3 fingers: index + middle + ring
-            elif ext_flags.get('index', False) and ext_flags.get('middle', False) and ext_flags.get('ring', False) and ext_flags.get('pinky', False):
-                target_knob = 'high'    # 4 fingers: index + middle + ring + pinky
+            target_knob = self._TARGET_BY_MASK[finger_mask]
             
-            pointer_up = self.is_pointer_finger_up(landmarks)
+            pointer_up = self.is_pointer_finger_up(lms, valid)
             
             if target_knob and pointer_up and not self.knob_locked2:
                 # Starting new gesture or switching knobs
@@ -813,17 +938,12 @@ class HandDetectorWithMIDI:
                     if self.show_console_output and prev_active != self.active_knob2:
                         print(f"[Deck2] Started {target_knob} control at angle {current_angle:.1f}°")
                 elif self.active_knob2 == target_knob and self.gesture_active2 and self.previous_angle2 is not None:
-                    delta_angle = current_angle - self.previous_angle2
-                    if delta_angle > 180:
-                        delta_angle -= 360
-                    elif delta_angle < -180:
-                        delta_angle += 360
                     params = self.knob_params[target_knob]
-                    sensitivity = params['range'] / self.knob_max_angle
-                    scaled_delta = delta_angle * sensitivity
-                    new_value = self.knobs2[target_knob] + scaled_delta
-                    self.knobs2[target_knob] = max(params['min'], min(params['max'], new_value))
-                    self.previous_angle2 = current_angle
+                    self.knobs2[target_knob], self.previous_angle2 = _apply_rotation(
+                        self.knobs2[target_knob], current_angle, self.previous_angle2,
+                        params['min'], params['max'], params['range'], self.knob_max_angle
+                    )
+                    self._midi_dirty.set()
             elif not pointer_up and self.gesture_active2:
                 if self.active_knob2 and self.show_console_output:
                     print(f"[Deck2] Gesture ended - {self.active_knob2} locked at {self.knobs2[self.active_knob2]:.2f}")
@@ -851,26 +971,24 @@ class HandDetectorWithMIDI:
         - Ascending Y for the thumb chain: y0 < y1 < y2 < y3 < y4.
         """
         try:
-            # Record pixel locations of all points (store for debugging/inspection)
+            # Record pixel locations of all points (debugging/inspection only)
             # Assumes landmark.x, landmark.y are pixel coordinates or already scaled.
-            self.last_landmark_pixels = [
-                (int(round(lm.x)), int(round(lm.y))) for lm in landmarks
-            ]
+            debug = self.show_all_landmarks or self.show_console_output
+            if debug:
+                self.last_landmark_pixels = [
+                    (int(round(lm.x)), int(round(lm.y))) for lm in landmarks
+                ]
 
             # Safety: ensure we have at least 21 landmarks
             if len(landmarks) < 21:
                 return False
             # Extract X and Y for required indices
-            thumb_indices = [0, 1, 2, 3, 4]
-            other_indices = list(range(5, 21))
-            knuckles_indices = [5, 9, 13, 17]
-
-            thumb_x = [landmarks[i].x for i in thumb_indices]
-            other_x = [landmarks[i].x for i in other_indices]
-            knuckles_x = [landmarks[i].x for i in knuckles_indices]
+            thumb_x = [landmarks[i].x for i in _THUMB_INDICES]
+            other_x = [landmarks[i].x for i in _OTHER_INDICES]
+            knuckles_x = [landmarks[i].x for i in _KNUCKLE_INDICES]
 
-            thumb_y = [landmarks[i].y for i in thumb_indices]
-            knuckles_y = [landmarks[i].y for i in knuckles_indices]
+            thumb_y = [landmarks[i].y for i in _THUMB_INDICES]
+            knuckles_y = [landmarks[i].y for i in _KNUCKLE_INDICES]
 
             # X-side constraint (deck-specific, no other allowance)
             all_left = max(thumb_x) < min(other_x)
@@ -896,15 +1014,15 @@ class HandDetectorWithMIDI:
 
             valid = bool(x_side_ok and descending_y)
 
-            if valid:
+            if valid and debug:
                 # Prepare debug sets sorted by X for on-screen display
                 thumb_pts = [
                     (i, (int(round(landmarks[i].x)), int(round(landmarks[i].y))))
-                    for i in thumb_indices
+                    for i in _THUMB_INDICES
                 ]
                 other_pts = [
                     (i, (int(round(landmarks[i].x)), int(round(landmarks[i].y))))
-                    for i in other_indices
+                    for i in _OTHER_INDICES
                 ]
                 thumb_pts_sorted = sorted(thumb_pts, key=lambda t: t[1][0])
                 other_pts_sorted = sorted(other_pts, key=lambda t: t[1][0])
@@ -990,13 +1108,14 @@ class HandDetectorWithMIDI:
         
         # Feature 1-4: EQ and Filter Dials (per hand, hidden unless active)
         active_knob = self.active_knob or self.active_knob2
-        current_time = time.time()
-        if self.active_knob in ['filter', 'low', 'mid', 'high']:
+        # One clock read per frame; every timestamp here is only compared against another
+        current_time = time.monotonic()
+        if self.active_knob in _KNOB_NAMES:
             self._last_knob_time1 = current_time
-        if self.active_knob2 in ['filter', 'low', 'mid', 'high']:
+        if self.active_knob2 in _KNOB_NAMES:
             self._last_knob_time2 = current_time
         # Left-hand dial (left side) if active recently
-        if self.active_knob in ['filter', 'low', 'mid', 'high'] and (current_time - self._last_knob_time1) < self._knob_timeout:
+        if self.active_knob in _KNOB_NAMES and (current_time - self._last_knob_time1) < self._knob_timeout:
             # Choose color and label
             if self.active_knob == 'filter':
                 color = yellow; label = "FILTER"
@@ -1036,7 +1155,7 @@ class HandDetectorWithMIDI:
             cv2.circle(frame, (center_x, center_y), 8, color, -1)
             cv2.putText(frame, label, (center_x - 60, center_y + radius + 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
         # Right-hand dial (right side) if active recently
-        if self.active_knob2 in ['filter', 'low', 'mid', 'high'] and (current_time - self._last_knob_time2) < self._knob_timeout:
+        if self.active_knob2 in _KNOB_NAMES and (current_time - self._last_knob_time2) < self._knob_timeout:
             if self.active_knob2 == 'filter':
                 color = yellow; label = "FILTER"
             elif self.active_knob2 == 'low':
@@ -1072,7 +1191,6 @@ class HandDetectorWithMIDI:
             cv2.putText(frame, label, (center_x - 60, center_y + radius + 30), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
         
         # Feature 5: Thumbs Up Play/Stop Buttons per hand (hidden unless active)
-        current_time = time.time()
         # Left hand (deck1)
         if self.thumbs_up_detected:
             if not self._last_thumbs_detection1:
@@ -1407,12 +1525,24 @@ class HandDetectorWithMIDI:
             self.effect_particles_right = []
             self._effect_started = False
     
+    def get_performance_stats(self):
+        """Session process_frame timing in ms (O(1), from the running aggregates)"""
+        n = self._n_frames
+        return {
+            'frames_processed': n,
+            'avg_processing_time': self._mean_ns * 1e-6,
+            'min_processing_time': self._min_ns * 1e-6 if n else 0.0,
+            'max_processing_time': self._max_ns * 1e-6,
+            'std_processing_time': math.sqrt(self._m2_ns / (n - 1)) * 1e-6 if n > 1 else 0.0,
+            'dropped_frames': self._dropped_frames
+        }
+    
     def draw_optimized_info(self, frame, landmark_data):
         """Draw information overlay"""
         # Calculate FPS
         if self.frame_times:
-            avg_frame_time = sum(self.frame_times) / len(self.frame_times)
-            fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
+            avg_frame_ns = sum(self.frame_times) / len(self.frame_times)
+            fps = 1e9 / avg_frame_ns if avg_frame_ns > 0 else 0
             self.fps_history.append(fps)
             avg_fps = sum(self.fps_history) / len(self.fps_history)
         else:
@@ -1433,6 +1563,78 @@ class HandDetectorWithMIDI:
         
         return frame
     
+    def _capture_loop(self, cap, frame_q, free_q, stop_event):
+        """Capture thread: keep only the newest camera frame on frame_q, reading into recycled buffers"""
+        buf = None
+        while not stop_event.is_set():
+            if buf is None:
+                try:
+                    buf = free_q.get_nowait()
+                except queue.Empty:
+                    pass
+            # cap.read decodes in place when buf matches the camera frame shape
+            ret, frame = cap.read(buf)
+            if not ret:
+                # A failed read returns immediately; back off instead of spinning, but wake on stop
+                stop_event.wait(0.01)
+                continue
+            buf = None
+            try:
+                frame_q.put_nowait(frame)
+            except queue.Full:
+                # Drop the stale frame so the main loop always gets the latest one
+                try:
+                    buf = frame_q.get_nowait()
+                    self._dropped_frames += 1
+                except queue.Empty:
+                    pass
+                frame_q.put_nowait(frame)
+    
+    def _on_quit(self):
+        """Stop the main loop after the current frame"""
+        self._should_stop = True
+    
+    def _on_toggle_console(self):
+        """Toggle console output"""
+        self.show_console_output = not self.show_console_output
+        print(f"Console output: {'ON' if self.show_console_output else 'OFF'}")
+    
+    def _on_toggle_landmarks(self):
+        """Toggle landmarks display"""
+        self.show_all_landmarks = not self.show_all_landmarks
+        print(f"All landmarks: {'ON' if self.show_all_landmarks else 'OFF'}")
+    
+    def _on_save_frame(self):
+        """Save the last displayed frame"""
+        if self._last_final_frame is None:
+            return
+        cv2.imwrite(f'hand_detection_midi_frame_{self.frame_count}.jpg', self._last_final_frame)
+        print(f"Saved frame {self.frame_count}")
+    
+    def _on_reset_knobs(self):
+        """Reset all knobs to default values"""
+        self.knobs = {k: v['default'] for k, v in self.knob_params.items()}
+        self.previous_angle = None
+        self.active_knob = None
+        self.knob_locked = False
+        self.gesture_active = False
+        self._midi_dirty.set()
+        print("All knobs reset to default values")
+    
+    def _on_midi_test(self):
+        """Send MIDI test sequence"""
+        if self.midi_device:
+            print("Sending MIDI test sequence...")
+            self.midi_device.send_test_sequence()
+        else:
+            print("MIDI device not available")
+    
+    def _on_toggle_midi_debug(self):
+        """Toggle MIDI debug output"""
+        if self.midi_device:
+            self.midi_device.debug = not self.midi_device.debug
+            print(f"MIDI Debug output: {'ON' if self.midi_device.debug else 'OFF'}")
+    
     def run(self):
         """Main loop with MIDI integration"""
         # Initialize camera
@@ -1449,6 +1651,9 @@ class HandDetectorWithMIDI:
             # If HighGUI backend does not support this, continue gracefully
             pass
         
+        # Request the camera's compressed MJPG stream: raw YUYV at 720p saturates USB 2.0 well below 30 fps,
+        # and the backend decodes MJPG in native code (ignored by cameras/backends without it)
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
         cap.set(cv2.CAP_PROP_FPS, 30)
@@ -1481,69 +1686,67 @@ class HandDetectorWithMIDI:
         else:
             print("\n✗ MIDI Output: Disabled")
         
-        frame_count = 0
+        self.frame_count = 0
+        self._should_stop = False
+        
+        # Camera reads run on their own thread (cap.read() blocks in native code without the GIL),
+        # so waiting for the next frame overlaps MediaPipe inference on the current one
+        # Frames go back on free_q once flipped, so steady-state capture allocates nothing
+        frame_q = queue.Queue(maxsize=1)
+        free_q = queue.Queue()
+        capture_stop = threading.Event()
+        capture_thread = threading.Thread(target=self._capture_loop, args=(cap, frame_q, free_q, capture_stop),
+                                          daemon=True)
+        capture_thread.start()
         
         try:
-            while True:
-                ret, frame = cap.read()
-                if not ret:
+            while not self._should_stop:
+                try:
+                    frame = frame_q.get(timeout=0.1)
+                except queue.Empty:
                     continue
                 
-                frame_count += 1
+                self.frame_count += 1
                 
-                # Flip for mirror effect
-                frame = cv2.flip(frame, 1)
+                # Flip for mirror effect into the reusable buffer
+                self._flip_buf = self._ensure_buffer(self._flip_buf, frame)
+                raw = frame
+                frame = cv2.flip(raw, 1, dst=self._flip_buf)
+                free_q.put_nowait(raw)
                 
                 # Process frame
                 annotated_frame, landmark_data = self.process_frame(frame)
                 
                 # Add overlay information
                 final_frame = self.draw_optimized_info(annotated_frame, landmark_data)
+                self._last_final_frame = final_frame
                 
                 # Display frame
                 cv2.imshow('GesteDJ', final_frame)
                 
                 # Handle key presses
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
-                    break
-                elif key == ord('c'):
-                    self.show_console_output = not self.show_console_output
-                    print(f"Console output: {'ON' if self.show_console_output else 'OFF'}")
-                elif key == ord('a'):
-                    self.show_all_landmarks = not self.show_all_landmarks
-                    print(f"All landmarks: {'ON' if self.show_all_landmarks else 'OFF'}")
-                elif key == ord('s'):
-                    cv2.imwrite(f'hand_detection_midi_frame_{frame_count}.jpg', final_frame)
-                    print(f"Saved frame {frame_count}")
-                elif key == ord('r'):
-                    # Reset all knobs
-                    self.knobs = {k: v['default'] for k, v in self.knob_params.items()}
-                    self.previous_angle = None
-                    self.active_knob = None
-                    self.knob_locked = False
-                    self.gesture_active = False
-                    print("All knobs reset to default values")
-                elif key == ord('t'):
-                    # Send MIDI test sequence
-                    if self.midi_device:
-                        print("Sending MIDI test sequence...")
-                        self.midi_device.send_test_sequence()
-                    else:
-                        print("MIDI device not available")
-                elif key == ord('d'):
-                    if self.midi_device:
-                        self.midi_device.debug = not self.midi_device.debug
-                        print(f"MIDI Debug output: {'ON' if self.midi_device.debug else 'OFF'}")
+                handler = self._key_handlers.get(cv2.waitKey(1) & 0xFF)
+                if handler is not None:
+                    handler()
         
         except KeyboardInterrupt:
             print("\nShutting down...")
         
         finally:
             # Cleanup
+            capture_stop.set()
+            capture_thread.join(timeout=1.0)
             cap.release()
             cv2.destroyAllWindows()
             self.close_midi()
+            stats = self.get_performance_stats()
+            if stats['frames_processed']:
+                print(f"Processed {stats['frames_processed']} frames: "
+                      f"avg {stats['avg_processing_time']:.1f}ms, "
+                      f"min {stats['min_processing_time']:.1f}ms, "
+                      f"max {stats['max_processing_time']:.1f}ms, "
+                      f"std {stats['std_processing_time']:.1f}ms, "
+                      f"{stats['dropped_frames']} stale camera frames dropped")
             print("AI DJ Hand detection stopped.")
 
 if __name__ == "__main__":
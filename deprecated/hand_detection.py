@@ -1,43 +1,266 @@
 import cv2
 import mediapipe as mp
 import numpy as np
+import operator
+import os
+import queue
+import sys
+import threading
 import time
+from itertools import chain
+
+# Optional: MediaPipe Tasks HandLandmarker (GPU delegate capable)
+try:
+    from mediapipe.tasks import python as mp_python
+    from mediapipe.tasks.python import vision
+    from mediapipe.framework.formats import landmark_pb2
+    MP_TASKS_AVAILABLE = True
+except ImportError:
+    MP_TASKS_AVAILABLE = False
+
+# Same model the Electron renderer loads; download it next to this file to enable the Tasks path
+HAND_LANDMARKER_MODEL = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hand_landmarker.task')
+HAND_LANDMARKER_URL = "https://storage.googleapis.com/mediapipe-models/hand_landmarker/hand_landmarker/float16/1/hand_landmarker.task"
+
+# Key landmarks to display (thumb tip, index tip, middle tip, ring tip, pinky tip, wrist)
+KEY_LANDMARKS = (4, 8, 12, 16, 20, 0)
+LANDMARK_NAMES = ("Thumb Tip", "Index Tip", "Middle Tip", "Ring Tip", "Pinky Tip", "Wrist")
+KEY_LANDMARK_IDX = np.array(KEY_LANDMARKS)  # fancy index into a (21, 3) landmark array
+# (x, y, z) of one landmark in a single C-level call, instead of three Python attribute lookups
+LANDMARK_XYZ = operator.attrgetter('x', 'y', 'z')
+
+# Legacy-solution load shedding: drop to the lite model (model_complexity=0) once smoothed inference time
+# stays above 80% of the frame budget, and restore the full model after it stays under 40%
+TARGET_FPS = 60  # Matches the requested camera rate
+INFER_EMA_ALPHA = 0.1
+COMPLEXITY_DOWN_FRAMES = 30   # ~0.5 s over budget before downgrading
+COMPLEXITY_UP_FRAMES = 300    # ~5 s of headroom before upgrading again (avoids thrashing)
+
+# Default for HandDetector.verbose: dump every landmark to the console each frame (heavy stdout I/O)
+DEBUG = False
 
 class HandDetector:
-    def __init__(self):
-        # Initialize MediaPipe hands
+    __slots__ = (
+        'fast_mode', 'mp_hands', 'hands', 'landmarker', 'delegate',
+        '_latest_hands', '_last_timestamp_ms',
+        'mp_draw', 'mp_drawing_styles',
+        'fps_counter', 'fps_start_ns', 'fps',
+        '_landmark_scratch', '_active_hands', '_landmark_buf', 'verbose',
+        '_label_cache', '_dot_radius', '_dot_stamp',
+        '_prev_small', '_small_buf', '_last_hands', '_last_detect_time', '_motion_thresh', '_motion_refresh',
+        '_stop_event', '_rgb_buf',
+        'model_complexity', '_infer_ema_ms', '_over_budget', '_under_budget'
+    )
+    
+    def __init__(self, fast_mode: bool = False):
+        """
+        fast_mode: capture 640x480 MJPG instead of 1280x720. Roughly a third of the bytes per frame
+        through conversion, inference input and drawing; landmarks are normalized so gesture logic
+        is unchanged, but small or distant hands are detected less reliably at the lower resolution.
+        """
+        self.fast_mode = fast_mode
+        
+        # Initialize MediaPipe hands: Tasks HandLandmarker (GPU, then CPU), else legacy solution
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
+        self.hands = None
+        self.landmarker = None
+        self.delegate = None
+        
+        # Latest async LIVE_STREAM result, written by the landmarker callback thread.
+        # The callback swaps in a fresh list and readers take the reference, so no lock is needed
+        self._latest_hands = []
+        self._last_timestamp_ms = -1
+        
+        # Adaptive model complexity (legacy solution only)
+        self.model_complexity = 1
+        self._infer_ema_ms = 0.0
+        self._over_budget = 0
+        self._under_budget = 0
+        
+        self._init_landmarker()
+        if self.landmarker is None:
+            self.hands = self._create_hands(self.model_complexity)
+            self.delegate = 'CPU (legacy solution)'
         self.mp_draw = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
         
-        # Key landmarks to display (thumb tip, index tip, middle tip, ring tip, pinky tip, wrist)
-        self.key_landmarks = [4, 8, 12, 16, 20, 0]
-        self.landmark_names = ["Thumb Tip", "Index Tip", "Middle Tip", "Ring Tip", "Pinky Tip", "Wrist"]
-        
         # Performance tracking
         self.fps_counter = 0
-        self.fps_start_time = time.time()
+        self.fps_start_ns = time.monotonic_ns()
         self.fps = 0
+        
+        # Reused per-frame landmark output: up to 2 hands x key landmarks, same schema as before
+        self._landmark_scratch = [
+            {
+                'hand_index': hand_idx,
+                'landmarks': [
+                    {'name': name, 'x': 0, 'y': 0, 'z': 0.0, 'normalized_x': 0.0, 'normalized_y': 0.0}
+                    for name in LANDMARK_NAMES
+                ]
+            }
+            for hand_idx in range(2)
+        ]
+        self._active_hands = 0
+        # All 21 landmarks per hand, filled in place each frame (views are only valid until the next frame)
+        self._landmark_buf = np.zeros((2, 21, 3), dtype=np.float32)
+        
+        # Per-frame console dump of landmark data
+        self.verbose = DEBUG
+        
+        # Pre-rendered static label masks; only the numeric suffixes go through putText per frame
+        self._label_cache = {}
+        for name in LANDMARK_NAMES:
+            self._get_label(f"{name}: ", 0.4, 1)
+        for hand_idx in range(2):
+            self._get_label(f"Hand {hand_idx + 1}:", 0.6, 2)
+        
+        # Filled 8px-radius landmark dot, stamped by slice assignment instead of cv2.circle
+        self._dot_radius = 4 if fast_mode else 8
+        dot = np.zeros((2 * self._dot_radius + 1, 2 * self._dot_radius + 1), dtype=np.uint8)
+        cv2.circle(dot, (self._dot_radius, self._dot_radius), self._dot_radius, 255, -1)
+        self._dot_stamp = dot > 0
+        for landmark_idx in KEY_LANDMARKS:
+            self._get_label(str(landmark_idx), 0.5, 1)
+        
+        # Motion gate state (sum of absolute differences over an 80x45 BGR thumbnail)
+        self._prev_small = None
+        self._small_buf = np.empty((45, 80, 3), dtype=np.uint8)  # swapped with _prev_small on each detection
+        self._last_hands = None
+        self._last_detect_time = 0.0
+        self._motion_thresh = 300000
+        self._motion_refresh = 0.5  # seconds
+        
+        # Pipeline shutdown signal shared by the reader and inference threads
+        self._stop_event = threading.Event()
+        
+        # Reused RGB buffer for the MediaPipe input (avoids a fresh HxWx3 allocation per frame)
+        self._rgb_buf = None
+    
+    def _init_landmarker(self):
+        """Create a LIVE_STREAM HandLandmarker, trying the GPU delegate before CPU"""
+        if not MP_TASKS_AVAILABLE:
+            return
+        if not os.path.exists(HAND_LANDMARKER_MODEL):
+            print(f"HandLandmarker model not found at {HAND_LANDMARKER_MODEL}; "
+                  f"using legacy solution (download: {HAND_LANDMARKER_URL})")
+            return
+        
+        for delegate in (mp_python.BaseOptions.Delegate.GPU, mp_python.BaseOptions.Delegate.CPU):
+            try:
+                options = vision.HandLandmarkerOptions(
+                    base_options=mp_python.BaseOptions(
+                        model_asset_path=HAND_LANDMARKER_MODEL,
+                        delegate=delegate
+                    ),
+                    running_mode=vision.RunningMode.LIVE_STREAM,
+                    num_hands=2,
+                    min_hand_detection_confidence=0.7,
+                    min_tracking_confidence=0.5,
+                    result_callback=self._on_result
+                )
+                self.landmarker = vision.HandLandmarker.create_from_options(options)
+                self.delegate = delegate.name
+                return
+            except Exception as e:
+                print(f"HandLandmarker {delegate.name} delegate unavailable: {e}")
+    
+    def _on_result(self, result, output_image, timestamp_ms):
+        """LIVE_STREAM callback: convert detected hands to landmark lists for drawing"""
+        hands = []
+        for hand in result.hand_landmarks:
+            landmark_list = landmark_pb2.NormalizedLandmarkList()
+            landmark_list.landmark.extend(
+                landmark_pb2.NormalizedLandmark(x=lm.x, y=lm.y, z=lm.z) for lm in hand
+            )
+            hands.append(landmark_list)
+        self._latest_hands = hands
+    
+    def _create_hands(self, model_complexity):
+        """Legacy MediaPipe Hands solution (model_complexity 1 = full, 0 = lite)"""
+        return self.mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=2,
+            min_detection_confidence=0.7,
+            min_tracking_confidence=0.5,
+            model_complexity=model_complexity
+        )
+    
+    def _adapt_complexity(self, infer_ms):
+        """Track an EMA of inference time and swap the legacy model under sustained load changes"""
+        self._infer_ema_ms += INFER_EMA_ALPHA * (infer_ms - self._infer_ema_ms)
+        budget_ms = 1000.0 / TARGET_FPS
+        
+        if self._infer_ema_ms > 0.8 * budget_ms:
+            self._over_budget += 1
+            self._under_budget = 0
+        elif self._infer_ema_ms < 0.4 * budget_ms:
+            self._under_budget += 1
+            self._over_budget = 0
+        else:
+            self._over_budget = 0
+            self._under_budget = 0
+        
+        if self.model_complexity > 0 and self._over_budget >= COMPLEXITY_DOWN_FRAMES:
+            complexity = 0
+        elif self.model_complexity < 1 and self._under_budget >= COMPLEXITY_UP_FRAMES:
+            complexity = 1
+        else:
+            return
+        
+        self.hands.close()
+        self.hands = self._create_hands(complexity)
+        self.model_complexity = complexity
+        self._over_budget = 0
+        self._under_budget = 0
+        if self.verbose:
+            print(f"Model complexity -> {complexity} (inference EMA {self._infer_ema_ms:.1f}ms)")
+    
+    def detect_hands(self, rgb_frame):
+        """Run hand detection; returns a list of landmark lists (latest async result on the Tasks path)"""
+        if self.landmarker is None:
+            start_ns = time.perf_counter_ns()
+            results = self.hands.process(rgb_frame)
+            self._adapt_complexity((time.perf_counter_ns() - start_ns) * 1e-6)
+            return results.multi_hand_landmarks or []
+        
+        # detect_async requires strictly increasing timestamps
+        timestamp_ms = max(int(time.monotonic() * 1000), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+        self.landmarker.detect_async(image, timestamp_ms)
+        
+        return self._latest_hands
     
     def process_frame(self, frame):
         """Process a single frame and return annotated frame with landmarks"""
-        # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Process the frame
-        results = self.hands.process(rgb_frame)
+        # Motion gate: reuse the last detection while an 80x45 thumbnail barely changes,
+        # re-running inference at least every _motion_refresh seconds in case tracking was lost
+        small = cv2.resize(frame, (80, 45), dst=self._small_buf, interpolation=cv2.INTER_AREA)
+        now = time.monotonic()
+        if (self._last_hands is not None
+                and now - self._last_detect_time < self._motion_refresh
+                and cv2.norm(small, self._prev_small, cv2.NORM_L1) < self._motion_thresh):
+            multi_hand_landmarks = self._last_hands
+        else:
+            # Convert BGR to RGB for MediaPipe into the reused buffer
+            if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+                self._rgb_buf = np.empty_like(frame)
+            self._rgb_buf.flags.writeable = True
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+            
+            # Mark read-only so MediaPipe can use the buffer without copying it
+            rgb_frame.flags.writeable = False
+            multi_hand_landmarks = self.detect_hands(rgb_frame)
+            
+            self._last_hands = multi_hand_landmarks
+            self._prev_small, self._small_buf = small, self._prev_small
+            self._last_detect_time = now
         
-        # Draw landmarks and get coordinates
-        landmark_data = []
+        # Draw landmarks and get coordinates (written into the reused scratch structures)
+        self._active_hands = 0
         
-        if results.multi_hand_landmarks:
-            for hand_idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
+        if multi_hand_landmarks:
+            for hand_idx, hand_landmarks in enumerate(multi_hand_landmarks[:len(self._landmark_scratch)]):
                 # Draw hand landmarks
                 self.mp_draw.draw_landmarks(
                     frame, 
@@ -49,34 +272,70 @@ class HandDetector:
                 
                 # Extract key landmark coordinates
                 h, w, _ = frame.shape
-                hand_data = []
+                # One bulk pull across the protobuf boundary, then NumPy indexing
+                all_lm = self._landmark_buf[hand_idx]
+                all_lm.reshape(-1)[:] = np.fromiter(
+                    chain.from_iterable(map(LANDMARK_XYZ, hand_landmarks.landmark)),
+                    dtype=np.float32, count=63
+                )
+                key_lm = all_lm[KEY_LANDMARK_IDX].tolist()
+                key_xy = (all_lm[KEY_LANDMARK_IDX, :2] * (w, h)).astype(np.int32).tolist()
+                hand_data = self._landmark_scratch[hand_idx]['landmarks']
                 
-                for i, landmark_idx in enumerate(self.key_landmarks):
-                    landmark = hand_landmarks.landmark[landmark_idx]
-                    x = int(landmark.x * w)
-                    y = int(landmark.y * h)
-                    z = landmark.z
+                for i, landmark_idx in enumerate(KEY_LANDMARKS):
+                    x, y = key_xy[i]
                     
-                    hand_data.append({
-                        'name': self.landmark_names[i],
-                        'x': x,
-                        'y': y,
-                        'z': z,
-                        'normalized_x': landmark.x,
-                        'normalized_y': landmark.y
-                    })
+                    entry = hand_data[i]
+                    entry['x'] = x
+                    entry['y'] = y
+                    entry['normalized_x'], entry['normalized_y'], entry['z'] = key_lm[i]
                     
                     # Draw landmark index on frame
-                    cv2.circle(frame, (x, y), 8, (255, 0, 0), -1)
-                    cv2.putText(frame, str(landmark_idx), (x + 10, y - 10), 
-                              cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+                    self._stamp_dot(frame, (x, y), (255, 0, 0))
+                    self._blit_label(frame, str(landmark_idx), (x + 10, y - 10), 0.5, (255, 255, 255))
                 
-                landmark_data.append({
-                    'hand_index': hand_idx,
-                    'landmarks': hand_data
-                })
+                self._active_hands = hand_idx + 1
         
-        return frame, landmark_data
+        # Read-only view for this frame; the entries are overwritten by the next process_frame
+        return frame, self._landmark_scratch[:self._active_hands]
+    
+    def _get_label(self, text, scale, thickness):
+        """Return (mask, advance, top, left) for a static label, rendering it on first use"""
+        key = (text, scale, thickness)
+        label = self._label_cache.get(key)
+        if label is None:
+            font = cv2.FONT_HERSHEY_SIMPLEX
+            (w, h), baseline = cv2.getTextSize(text, font, scale, thickness)
+            pad = thickness
+            canvas = np.zeros((h + baseline + 2 * pad, w + 2 * pad), dtype=np.uint8)
+            cv2.putText(canvas, text, (pad, h + pad), font, scale, 255, thickness)
+            # Hershey advances are fractional; measure over repeated runs of the label
+            advance = (cv2.getTextSize(text * 10, font, scale, thickness)[0][0] - w) / 9.0
+            label = (canvas > 0, int(round(advance)), h + pad, pad)
+            self._label_cache[key] = label
+        return label
+    
+    def _blit_label(self, frame, text, org, scale, color, thickness=1):
+        """Draw a cached static label at a putText-style origin; returns the x after it"""
+        mask, advance, top, left = self._get_label(text, scale, thickness)
+        x0, y0 = org[0] - left, org[1] - top
+        frame_h, frame_w = frame.shape[:2]
+        mask_h, mask_w = mask.shape
+        cx0, cy0 = max(x0, 0), max(y0, 0)
+        cx1, cy1 = min(x0 + mask_w, frame_w), min(y0 + mask_h, frame_h)
+        if cx1 > cx0 and cy1 > cy0:
+            frame[cy0:cy1, cx0:cx1][mask[cy0 - y0:cy1 - y0, cx0 - x0:cx1 - x0]] = color
+        return org[0] + advance
+    
+    def _stamp_dot(self, frame, center, color):
+        """Draw the cached landmark dot centered at (x, y), clipped to the frame"""
+        r = self._dot_radius
+        x0, y0 = center[0] - r, center[1] - r
+        frame_h, frame_w = frame.shape[:2]
+        cx0, cy0 = max(x0, 0), max(y0, 0)
+        cx1, cy1 = min(x0 + 2 * r + 1, frame_w), min(y0 + 2 * r + 1, frame_h)
+        if cx1 > cx0 and cy1 > cy0:
+            frame[cy0:cy1, cx0:cx1][self._dot_stamp[cy0 - y0:cy1 - y0, cx0 - x0:cx1 - x0]] = color
     
     def draw_landmark_info(self, frame, landmark_data):
         """Draw landmark information on the frame"""
@@ -90,13 +349,13 @@ class HandDetector:
         # Draw landmark data
         for hand_data in landmark_data:
             hand_idx = hand_data['hand_index']
-            cv2.putText(frame, f"Hand {hand_idx + 1}:", (10, y_offset), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
+            self._blit_label(frame, f"Hand {hand_idx + 1}:", (10, y_offset), 0.6, (255, 255, 0), 2)
             y_offset += 25
             
             for landmark in hand_data['landmarks']:
-                text = f"{landmark['name']}: ({landmark['x']}, {landmark['y']}, {landmark['z']:.3f})"
-                cv2.putText(frame, text, (10, y_offset), 
+                x = self._blit_label(frame, f"{landmark['name']}: ", (10, y_offset), 0.4, (255, 255, 255))
+                text = f"({landmark['x']}, {landmark['y']}, {landmark['z']:.3f})"
+                cv2.putText(frame, text, (x, y_offset), 
                            cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
                 y_offset += 20
             
@@ -107,41 +366,45 @@ class HandDetector:
     def update_fps(self):
         """Update FPS calculation"""
         self.fps_counter += 1
-        current_time = time.time()
+        now = time.monotonic_ns()
+        elapsed_ns = now - self.fps_start_ns
         
-        if current_time - self.fps_start_time >= 1.0:
-            self.fps = self.fps_counter / (current_time - self.fps_start_time)
+        if elapsed_ns >= 1_000_000_000:
+            self.fps = self.fps_counter * 1e9 / elapsed_ns
             self.fps_counter = 0
-            self.fps_start_time = current_time
+            self.fps_start_ns = now
     
-    def run(self):
-        """Main loop for hand detection"""
-        # Initialize camera
-        cap = cv2.VideoCapture(0)
-        
-        # Optimize camera settings for performance
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-        cap.set(cv2.CAP_PROP_FPS, 60)
-        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Reduce buffer to minimize lag
-        
-        if not cap.isOpened():
-            print("Error: Could not open camera")
-            return
-        
-        print("Hand Detection Started! Press 'q' to quit.")
-        print("Key landmarks being tracked:")
-        for i, name in enumerate(self.landmark_names):
-            print(f"  {self.key_landmarks[i]}: {name}")
-        
-        while True:
+    @staticmethod
+    def _put_latest(q, item):
+        """Put item on a bounded queue, dropping the oldest entry instead of blocking on a stale frame"""
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+            q.put_nowait(item)
+    
+    def _reader_loop(self, cap, read_q):
+        """Capture thread: read and mirror camera frames"""
+        while not self._stop_event.is_set():
             ret, frame = cap.read()
             if not ret:
                 print("Error: Could not read frame")
+                self._stop_event.set()
                 break
             
             # Flip frame horizontally for mirror effect
-            frame = cv2.flip(frame, 1)
+            self._put_latest(read_q, cv2.flip(frame, 1))
+    
+    def _inference_loop(self, read_q, disp_q):
+        """Inference thread: detect hands and draw overlays for display"""
+        while not self._stop_event.is_set():
+            try:
+                frame = read_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
             
             # Process frame
             annotated_frame, landmark_data = self.process_frame(frame)
@@ -152,24 +415,84 @@ class HandDetector:
             # Update FPS
             self.update_fps()
             
-            # Print landmark data to console (optional, can be commented out for better performance)
-            if landmark_data:
-                print(f"\nFrame - FPS: {self.fps:.1f}")
+            # Print landmark data to console (verbose only), one buffered write per frame
+            if self.verbose and landmark_data:
+                lines = [f"\nFrame - FPS: {self.fps:.1f}"]
                 for hand_data in landmark_data:
-                    print(f"Hand {hand_data['hand_index'] + 1}:")
+                    lines.append(f"Hand {hand_data['hand_index'] + 1}:")
                     for landmark in hand_data['landmarks']:
-                        print(f"  {landmark['name']}: x={landmark['x']}, y={landmark['y']}, z={landmark['z']:.3f}")
+                        lines.append(f"  {landmark['name']}: x={landmark['x']}, y={landmark['y']}, z={landmark['z']:.3f}")
+                sys.stdout.write("\n".join(lines) + "\n")
             
-            # Display frame
-            cv2.imshow('Hand Landmark Detection', final_frame)
-            
-            # Check for quit
-            if cv2.waitKey(1) & 0xFF == ord('q'):
-                break
+            self._put_latest(disp_q, final_frame)
+    
+    def run(self):
+        """Main loop for hand detection"""
+        # Initialize camera
+        cap = cv2.VideoCapture(0)
+        
+        # Optimize camera settings for performance
+        if self.fast_mode:
+            # MJPG decode is cheaper than raw YUYV at the camera boundary
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        else:
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+        cap.set(cv2.CAP_PROP_FPS, 60)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Reduce buffer to minimize lag
+        
+        if not cap.isOpened():
+            print("Error: Could not open camera")
+            return
+        
+        print("Hand Detection Started! Press 'q' to quit.")
+        print(f"Inference delegate: {self.delegate}")
+        if self.landmarker is None:
+            print(f"Model complexity: {self.model_complexity} (drops to 0 under sustained load)")
+        if self.fast_mode:
+            print("Fast mode: 640x480 MJPG capture")
+        print("Key landmarks being tracked:")
+        for landmark_idx, name in zip(KEY_LANDMARKS, LANDMARK_NAMES):
+            print(f"  {landmark_idx}: {name}")
+        
+        # Capture -> inference -> display, overlapped across threads
+        read_q = queue.Queue(maxsize=2)
+        disp_q = queue.Queue(maxsize=2)
+        self._stop_event.clear()
+        workers = [
+            threading.Thread(target=self._reader_loop, args=(cap, read_q), daemon=True),
+            threading.Thread(target=self._inference_loop, args=(read_q, disp_q), daemon=True)
+        ]
+        for worker in workers:
+            worker.start()
+        
+        # Display stays on the main thread (HighGUI windows are not thread-safe on every platform)
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    final_frame = disp_q.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                
+                cv2.imshow('Hand Landmark Detection', final_frame)
+                
+                # Check for quit
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    break
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._stop_event.set()
+            for worker in workers:
+                worker.join(timeout=1.0)
         
         # Cleanup
         cap.release()
         cv2.destroyAllWindows()
+        if self.landmarker is not None:
+            self.landmarker.close()
 
 if __name__ == "__main__":
     detector = HandDetector()
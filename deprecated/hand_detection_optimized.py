@@ -3,9 +3,53 @@ import mediapipe as mp
 import numpy as np
 import time
 import math
+import operator
 from collections import deque
+from itertools import chain
+
+# Index, middle, ring, pinky tip and PIP landmark indices for count_fingers
+FINGER_TIPS = np.array([8, 12, 16, 20])
+FINGER_PIPS = np.array([6, 10, 14, 18])
+# Finger-up bit per finger (bit 0 = index .. bit 3 = pinky)
+FINGER_BITS = np.array([1, 2, 4, 8], dtype=np.uint8)
+# Hand skeleton as (M, 2) landmark index pairs (same topology as mp.solutions.hands.HAND_CONNECTIONS)
+CONNECTIONS = np.array([
+    (0, 1), (1, 2), (2, 3), (3, 4),          # Thumb
+    (0, 5), (5, 6), (6, 7), (7, 8),          # Index
+    (5, 9), (9, 10), (10, 11), (11, 12),     # Middle
+    (9, 13), (13, 14), (14, 15), (15, 16),   # Ring
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20)  # Pinky + palm
+], dtype=np.int32)
+for _table in (FINGER_TIPS, FINGER_PIPS, FINGER_BITS, CONNECTIONS):
+    _table.flags.writeable = False
+
+# (x, y, z) of one landmark in a single C-level call, instead of three Python attribute lookups
+LANDMARK_XYZ = operator.attrgetter('x', 'y', 'z')
+
+# Wrist and fingertips shown in the overlay, and landmarks that must be in frame for knob control
+KEY_POINTS = (0, 4, 8, 12, 16, 20)
+REQUIRED_LANDMARKS = (0, 6, 8)  # Wrist, Index PIP, Index Tip
+# Console dump grouping
+FINGER_GROUPS = (
+    ('Wrist', (0,)),
+    ('Thumb', (1, 2, 3, 4)),
+    ('Index', (5, 6, 7, 8)),
+    ('Middle', (9, 10, 11, 12)),
+    ('Ring', (13, 14, 15, 16)),
+    ('Pinky', (17, 18, 19, 20))
+)
 
 class OptimizedHandDetector:
+    _FINGER_NAMES = ("Index", "Middle", "Ring", "Pinky")
+    # Knob selected by each 4-bit finger-up mask
+    _KNOB_FROM_MASK = tuple((None, 'filter', 'low', 'mid', 'high')[bin(m).count('1')] for m in range(16))
+    # Per-landmark dot color by finger
+    # Wrist: Yellow, Thumb: Red, Index: Green, Middle: Blue, Ring: Magenta, Pinky: Cyan
+    _LANDMARK_COLORS = (
+        ((0, 255, 255),) + ((0, 0, 255),) * 4 + ((0, 255, 0),) * 4 +
+        ((255, 0, 0),) * 4 + ((255, 0, 255),) * 4 + ((255, 255, 0),) * 4
+    )
+    
     def __init__(self):
         # Initialize MediaPipe hands with optimized settings
         self.mp_hands = mp.solutions.hands
@@ -47,11 +91,27 @@ class OptimizedHandDetector:
         
         # Performance tracking with moving average
         self.fps_history = deque(maxlen=30)
-        self.frame_times = deque(maxlen=5)
+        self.frame_times = deque(maxlen=5)  # process_frame durations in ns
+        self._rgb_buf = None  # Reused RGB conversion target
+        
+        # Per-hand result slots reused every frame (process_frame overwrites them in place).
+        # Each slot's arrays are views into one (max_num_hands, 21, ...) buffer; copy to keep past the next frame.
+        self._landmark_buf = np.zeros((2, 21, 3), dtype=np.float32)  # max_num_hands
+        self._pixel_buf = np.zeros((2, 21, 2), dtype=np.int32)
+        self._hand_pool = [
+            {
+                'hand_index': hand_idx,
+                'landmarks': self._landmark_buf[hand_idx],
+                'pixels': self._pixel_buf[hand_idx]
+            }
+            for hand_idx in range(len(self._landmark_buf))
+        ]
+        self._pixel_scratch = np.zeros((21, 2), dtype=np.float32)
         
         # Display options
         self.show_console_output = False  # Set to True to enable console printing
         self.show_all_landmarks = False   # Set to True to show all 21 landmarks
+        self._debug_labels = False        # Set to True to number each landmark dot
         
         # DJ Control System
         self.knobs = {
@@ -62,6 +122,29 @@ class OptimizedHandDetector:
         }
         self.knob_names = ['filter', 'low', 'mid', 'high']
         
+        # Knob panel rows: (knob name, label, color, row offset) - only the block's top y varies per frame
+        knob_colors = {
+            'filter': (255, 255, 0),  # Yellow
+            'low': (0, 255, 0),       # Green  
+            'mid': (0, 165, 255),     # Orange
+            'high': (0, 0, 255)       # Red
+        }
+        finger_mapping = {'filter': '1F', 'low': '2F', 'mid': '3F', 'high': '4F'}
+        self.knob_row_height = 25
+        self._knob_rows = [
+            (name, f"{finger_mapping[name]} {name.upper()}", knob_colors[name], i * self.knob_row_height)
+            for i, name in enumerate(self.knob_names)
+        ]
+        
+        # Knob bar geometry and static sprite (grey background + white center tick),
+        # blitted with one slice copy per knob instead of a rectangle + line
+        self.knob_bar_offset_x = 150
+        self.knob_bar_width = 100
+        self.knob_bar_height = 10
+        self._knob_bar_sprite = np.full((self.knob_bar_height + 1, self.knob_bar_width + 1, 3),
+                                        (100, 100, 100), dtype=np.uint8)
+        self._knob_bar_sprite[:, self.knob_bar_width // 2] = (255, 255, 255)
+        
         # Tracking variables for continuous control - FIXED STREAM LOGIC
         self.stream_initial_angle = None  # Initial angle when stream starts
         self.stream_previous_final_angle = {  # Final angle from previous streams
@@ -70,6 +153,7 @@ class OptimizedHandDetector:
         # Simple tracking - just remember previous angle
         self.previous_angle = None  # Previous frame's angle for delta calculation
         self.current_finger_count = 0
+        self.finger_mask = 0  # Finger-up bits from the last count_fingers call
         self.previous_finger_count = 0
         self.active_knob = None
         self.previous_active_knob = None
@@ -87,7 +171,7 @@ class OptimizedHandDetector:
         
     def process_frame(self, frame):
         """Process frame with optimizations"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Resize frame for faster processing (optional)
         height, width = frame.shape[:2]
@@ -97,117 +181,93 @@ class OptimizedHandDetector:
             new_height = int(height * scale)
             frame = cv2.resize(frame, (new_width, new_height))
         
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Convert BGR to RGB into a reused buffer (no per-frame allocation)
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty_like(frame)
+        self._rgb_buf.flags.writeable = True
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        # Read-only input lets MediaPipe wrap the buffer instead of copying it
+        rgb_frame.flags.writeable = False
         
         # Process the frame
         results = self.hands.process(rgb_frame)
         
-        # Extract landmark data
-        landmark_data = []
+        # Extract landmark data into the pooled per-hand slots
+        active_hands = 0
         
         if results.multi_hand_landmarks:
-            for hand_idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                # Draw landmarks with minimal style for performance
-                if self.show_all_landmarks:
-                    self.mp_draw.draw_landmarks(
-                        frame, 
-                        hand_landmarks, 
-                        self.mp_hands.HAND_CONNECTIONS
-                    )
-                
-                # Extract key landmarks only
+            for hand_idx, hand_landmarks in enumerate(results.multi_hand_landmarks[:len(self._hand_pool)]):
+                # All landmarks as one (21, 3) float32 array (normalized x, y, z) plus pixel coords
+                hand_data = self._hand_pool[hand_idx]
+                lms = hand_data['landmarks']
+                pixels = hand_data['pixels']
                 h, w = frame.shape[:2]
-                hand_data = []
+                lms.reshape(-1)[:] = np.fromiter(
+                    chain.from_iterable(map(LANDMARK_XYZ, hand_landmarks.landmark)),
+                    dtype=np.float32, count=63
+                )
+                np.multiply(lms[:, :2], (w, h), out=self._pixel_scratch)
+                np.copyto(pixels, self._pixel_scratch, casting='unsafe')
                 
-                for i, landmark_idx in enumerate(self.key_landmarks):
-                    landmark = hand_landmarks.landmark[landmark_idx]
-                    x = int(landmark.x * w)
-                    y = int(landmark.y * h)
-                    
-                    hand_data.append({
-                        'name': self.landmark_names[i],
-                        'x': x,
-                        'y': y,
-                        'z': landmark.z
-                    })
-                    
-                    # Draw landmarks with color coding by finger
-                    # Wrist: Yellow, Thumb: Red, Index: Green, Middle: Blue, Ring: Magenta, Pinky: Cyan
-                    if i == 0:  # Wrist
-                        color = (0, 255, 255)  # Yellow
-                    elif 1 <= i <= 4:  # Thumb
-                        color = (0, 0, 255)    # Red
-                    elif 5 <= i <= 8:  # Index
-                        color = (0, 255, 0)    # Green
-                    elif 9 <= i <= 12:  # Middle
-                        color = (255, 0, 0)    # Blue
-                    elif 13 <= i <= 16:  # Ring
-                        color = (255, 0, 255)  # Magenta
-                    else:  # Pinky (17-20)
-                        color = (255, 255, 0)  # Cyan
-                    
+                # Skeleton in a single polylines call
+                if self.show_all_landmarks:
+                    cv2.polylines(frame, pixels[CONNECTIONS], False, (224, 224, 224), 2)
+                
+                points = pixels[self.key_landmarks].tolist()
+                for (x, y), color in zip(points, self._LANDMARK_COLORS):
                     cv2.circle(frame, (x, y), 4, color, -1)
-                    # Show landmark number for clarity
-                    cv2.putText(frame, str(i), (x + 6, y - 6), 
-                              cv2.FONT_HERSHEY_SIMPLEX, 0.3, color, 1)
                 
-                landmark_data.append({
-                    'hand_index': hand_idx,
-                    'landmarks': hand_data
-                })
+                # Landmark numbers are debug-only text
+                if self._debug_labels:
+                    for i, ((x, y), color) in enumerate(zip(points, self._LANDMARK_COLORS)):
+                        cv2.putText(frame, str(i), (x + 6, y - 6), 
+                                  cv2.FONT_HERSHEY_SIMPLEX, 0.3, color, 1)
+                
+                active_hands = hand_idx + 1
                 
                 # Update DJ knob values for the first hand only
                 if hand_idx == 0:
-                    self.current_pointer_angle = self.update_knob_values(hand_landmarks.landmark)
+                    self.current_pointer_angle = self.update_knob_values(hand_landmarks.landmark, lms)
         
-        # Track processing time
-        process_time = time.time() - start_time
-        self.frame_times.append(process_time)
+        # Track processing time (integer nanoseconds)
+        self.frame_times.append(time.perf_counter_ns() - start_ns)
         
-        return frame, landmark_data
+        # Slots are overwritten by the next process_frame call
+        return frame, self._hand_pool[:active_hands]
+    
+    def landmark_dicts(self, hand_data):
+        """Materialize one hand's landmarks as [{'name', 'x', 'y', 'z'}, ...] (pixel x/y) for printing/JSON"""
+        return [
+            {'name': self.landmark_names[i], 'x': x, 'y': y, 'z': z}
+            for i, ((x, y), z) in enumerate(zip(hand_data['pixels'].tolist(), hand_data['landmarks'][:, 2].tolist()))
+        ]
     
-    def count_fingers(self, landmarks):
-        """SIMPLE finger counting with DEBUG OUTPUT"""
+    def count_fingers(self, lms):
+        """SIMPLE finger counting with DEBUG OUTPUT (lms: (21, 3) float32 landmark array)"""
         try:
-            fingers_up = 0
-            debug_info = []
+            # Simple check: tip above PIP joint (basic but reliable), all four fingers at once
+            tips = lms[FINGER_TIPS, :2]
+            pips = lms[FINGER_PIPS, :2]
             
-            # Simple check: tip above PIP joint (basic but reliable)
-            finger_data = [
-                ("Index", 8, 6),    # tip, pip
-                ("Middle", 12, 10),  # tip, pip
-                ("Ring", 16, 14),    # tip, pip
-                ("Pinky", 20, 18)    # tip, pip
-            ]
-            
-            for finger_name, tip_idx, pip_idx in finger_data:
-                try:
-                    tip = landmarks[tip_idx]
-                    pip = landmarks[pip_idx]
-                    
-                    # Check validity
-                    if (tip.x < 0 or tip.x > 1 or tip.y < 0 or tip.y > 1 or
-                        pip.x < 0 or pip.x > 1 or pip.y < 0 or pip.y > 1):
-                        debug_info.append(f"{finger_name}: INVALID")
-                        continue
-                    
-                    # Convert to pixel coordinates for debug
-                    tip_x, tip_y = int(tip.x * 1280), int(tip.y * 720)
-                    pip_x, pip_y = int(pip.x * 1280), int(pip.y * 720)
-                    
-                    # Simple check: tip above pip (lower y value = higher on screen)
-                    is_up = tip.y < pip.y
-                    
-                    if is_up:
-                        fingers_up += 1
-                        debug_info.append(f"{finger_name}: UP tip({tip_x},{tip_y}) pip({pip_x},{pip_y})")
-                    else:
-                        debug_info.append(f"{finger_name}: DOWN tip({tip_x},{tip_y}) pip({pip_x},{pip_y})")
-                        
-                except (IndexError, AttributeError):
-                    debug_info.append(f"{finger_name}: ERROR")
+            # Check validity
+            valid = ((tips >= 0) & (tips <= 1) & (pips >= 0) & (pips <= 1)).all(axis=1)
+            
+            # Tip above pip (lower y value = higher on screen)
+            is_up = valid & (tips[:, 1] < pips[:, 1])
+            self.finger_mask = int(is_up @ FINGER_BITS)
+            fingers_up = bin(self.finger_mask).count('1')
+            
+            # Convert to pixel coordinates for debug
+            tip_px = (tips * (1280, 720)).astype(np.int32).tolist()
+            pip_px = (pips * (1280, 720)).astype(np.int32).tolist()
+            debug_info = []
+            for i, finger_name in enumerate(self._FINGER_NAMES):
+                if not valid[i]:
+                    debug_info.append(f"{finger_name}: INVALID")
                     continue
+                state = "UP" if is_up[i] else "DOWN"
+                debug_info.append(f"{finger_name}: {state} tip({tip_px[i][0]},{tip_px[i][1]}) "
+                                  f"pip({pip_px[i][0]},{pip_px[i][1]})")
             
             # Store debug info for display
             self.finger_debug_info = debug_info
@@ -218,6 +278,7 @@ class OptimizedHandDetector:
         except Exception as e:
             self.finger_debug_info = [f"COUNT ERROR: {e}"]
             self.finger_debug_count = 0
+            self.finger_mask = 0
             return 0
     
     def is_finger_extended(self, vectors, joint_positions):
@@ -320,7 +381,7 @@ class OptimizedHandDetector:
                 print(f"Error calculating angle: {e}")
             return 0.0
     
-    def update_knob_values(self, landmarks):
+    def update_knob_values(self, landmarks, lms):
         """Update DJ knob values - FIXED STREAM LOGIC: prev_final + (curr - initial)"""
         try:
             # Validate landmarks
@@ -329,13 +390,12 @@ class OptimizedHandDetector:
                 return 0.0
             
             # Check if required landmarks are present and valid
-            required_landmarks = [0, 6, 8]  # Wrist, Index PIP, Index Tip
-            for idx in required_landmarks:
+            for idx in REQUIRED_LANDMARKS:
                 if landmarks[idx].x < 0 or landmarks[idx].x > 1 or landmarks[idx].y < 0 or landmarks[idx].y > 1:
                     self.handle_detection_loss()
                     return 0.0
             
-            finger_count = self.count_fingers(landmarks)
+            finger_count = self.count_fingers(lms)
             current_angle = self.calculate_pointer_angle(landmarks)
             
             # Store previous states
@@ -343,16 +403,8 @@ class OptimizedHandDetector:
             self.previous_active_knob = self.active_knob
             self.current_finger_count = finger_count
             
-            # Determine which knob should be active
-            target_knob = None
-            if finger_count == 1:
-                target_knob = 'filter'
-            elif finger_count == 2:
-                target_knob = 'low'
-            elif finger_count == 3:
-                target_knob = 'mid'
-            elif finger_count == 4:
-                target_knob = 'high'
+            # Determine which knob should be active from the finger-up bitmask
+            target_knob = self._KNOB_FROM_MASK[self.finger_mask]
             
             # Check if pointer finger is up using vector analysis
             pointer_up = self.is_pointer_finger_up(landmarks)
@@ -541,43 +593,31 @@ class OptimizedHandDetector:
         
         # Draw knobs
         y_pos += 30
-        knob_colors = {
-            'filter': (255, 255, 0),  # Yellow
-            'low': (0, 255, 0),       # Green  
-            'mid': (0, 165, 255),     # Orange
-            'high': (0, 0, 255)       # Red
-        }
-        
-        finger_mapping = {
-            'filter': '1F',
-            'low': '2F', 
-            'mid': '3F',
-            'high': '4F'
-        }
-        
-        for i, knob_name in enumerate(self.knob_names):
+        bar_x = interface_x + self.knob_bar_offset_x
+        bar_width = self.knob_bar_width
+        bar_height = self.knob_bar_height
+        center_x = bar_x + bar_width // 2
+        sprite = self._knob_bar_sprite
+        
+        for knob_name, label, color, row_offset in self._knob_rows:
+            row_y = y_pos + row_offset
             knob_value = self.knobs[knob_name]
-            color = knob_colors[knob_name]
             
             # Knob label and finger mapping
-            label = f"{finger_mapping[knob_name]} {knob_name.upper()}"
-            cv2.putText(frame, label, (interface_x, y_pos), 
+            cv2.putText(frame, label, (interface_x, row_y), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.4, color, 1)
             
             # Knob value
             value_text = f"{knob_value:+6.1f}°"
-            cv2.putText(frame, value_text, (interface_x + 80, y_pos), 
+            cv2.putText(frame, value_text, (interface_x + 80, row_y), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
             
-            # Knob visualization bar
-            bar_x = interface_x + 150
-            bar_y = y_pos - 8
-            bar_width = 100
-            bar_height = 10
-            
-            # Background bar
-            cv2.rectangle(frame, (bar_x, bar_y), 
-                         (bar_x + bar_width, bar_y + bar_height), (100, 100, 100), -1)
+            # Background bar and center line from the cached sprite (clipped to the frame)
+            bar_y = row_y - 8
+            rows = min(sprite.shape[0], height - bar_y)
+            cols = min(sprite.shape[1], width - bar_x)
+            if bar_y >= 0 and rows > 0 and cols > 0:
+                frame[bar_y:bar_y + rows, bar_x:bar_x + cols] = sprite[:rows, :cols]
             
             # Value bar (normalize -135 to +135 to 0 to bar_width)
             normalized_value = (knob_value + 135) / 270  # 0 to 1
@@ -585,25 +625,22 @@ class OptimizedHandDetector:
             if knob_value != 0:
                 cv2.rectangle(frame, (bar_x, bar_y), 
                              (bar_x + value_width, bar_y + bar_height), color, -1)
-            
-            # Center line
-            center_x = bar_x + bar_width // 2
-            cv2.line(frame, (center_x, bar_y), (center_x, bar_y + bar_height), 
-                    (255, 255, 255), 1)
+                # Keep the center line on top of the fill
+                if value_width >= bar_width // 2:
+                    cv2.line(frame, (center_x, bar_y), (center_x, bar_y + bar_height), 
+                            (255, 255, 255), 1)
             
             # Highlight active knob
             if self.active_knob == knob_name:
-                cv2.rectangle(frame, (interface_x - 5, y_pos - 12), 
-                             (interface_x + 250, y_pos + 8), (255, 255, 255), 2)
-            
-            y_pos += 25
+                cv2.rectangle(frame, (interface_x - 5, row_y - 12), 
+                             (interface_x + 250, row_y + 8), (255, 255, 255), 2)
     
     def draw_optimized_info(self, frame, landmark_data):
         """Draw minimal information overlay for maximum performance"""
         # Calculate average FPS
         if self.frame_times:
-            avg_frame_time = sum(self.frame_times) / len(self.frame_times)
-            fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
+            avg_frame_ns = sum(self.frame_times) / len(self.frame_times)
+            fps = 1e9 / avg_frame_ns if avg_frame_ns > 0 else 0
             self.fps_history.append(fps)
             avg_fps = sum(self.fps_history) / len(self.fps_history)
         else:
@@ -614,7 +651,7 @@ class OptimizedHandDetector:
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
         
         if self.frame_times:
-            cv2.putText(frame, f"Process: {avg_frame_time*1000:.1f}ms", (10, 60), 
+            cv2.putText(frame, f"Process: {avg_frame_ns * 1e-6:.1f}ms", (10, 60), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
         
         # Draw hand count
@@ -634,12 +671,11 @@ class OptimizedHandDetector:
                            cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 0), 1)
                 
                 # Show only key landmarks to save space
-                key_indices = [0, 4, 8, 12, 16, 20]  # Wrist and fingertips
                 y_pos = y_start + 15
                 
-                for i in key_indices:
+                for i in KEY_POINTS:
                     if i < len(hand_data['landmarks']):
-                        landmark = hand_data['landmarks'][i]
+                        x, y = hand_data['pixels'][i].tolist()
                         
                         # Color code by finger group
                         if i == 0:  # Wrist
@@ -655,7 +691,7 @@ class OptimizedHandDetector:
                         else:  # Pinky
                             color = (255, 255, 0)
                         
-                        text = f"{i}:{landmark['name'][:4]}({landmark['x']},{landmark['y']})"
+                        text = f"{i}:{self.landmark_names[i][:4]}({x},{y})"
                         cv2.putText(frame, text, (10, y_pos), 
                                    cv2.FONT_HERSHEY_SIMPLEX, 0.3, color, 1)
                         y_pos += 15
@@ -668,6 +704,9 @@ class OptimizedHandDetector:
         cap = cv2.VideoCapture(0)
         
         # Camera optimization
+        # Request the camera's compressed MJPG stream: raw YUYV at 720p saturates USB 2.0 well below 30 fps,
+        # and the backend decodes MJPG in native code (ignored by cameras/backends without it)
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
         cap.set(cv2.CAP_PROP_FPS, 30)  # Reduced for stability
@@ -713,26 +752,19 @@ class OptimizedHandDetector:
             # Add overlay information
             final_frame = self.draw_optimized_info(annotated_frame, landmark_data)
             
-            # Optional console output
+            # Optional console output, written as one block instead of ~30 separate prints per hand
             if self.show_console_output and landmark_data and frame_count % 10 == 0:
-                print(f"\nFrame {frame_count}:")
+                lines = [f"\nFrame {frame_count}:"]
                 for hand_data in landmark_data:
-                    print(f"Hand {hand_data['hand_index'] + 1}:")
+                    lines.append(f"Hand {hand_data['hand_index'] + 1}:")
+                    landmarks = self.landmark_dicts(hand_data)
                     # Group landmarks by finger for better readability
-                    finger_groups = {
-                        'Wrist': [0],
-                        'Thumb': [1, 2, 3, 4],
-                        'Index': [5, 6, 7, 8],
-                        'Middle': [9, 10, 11, 12],
-                        'Ring': [13, 14, 15, 16],
-                        'Pinky': [17, 18, 19, 20]
-                    }
-                    
-                    for finger_name, indices in finger_groups.items():
-                        print(f"  {finger_name}:")
+                    for finger_name, indices in FINGER_GROUPS:
+                        lines.append(f"  {finger_name}:")
                         for idx in indices:
-                            landmark = hand_data['landmarks'][idx]
-                            print(f"    {idx:2d}-{landmark['name']}: ({landmark['x']:3d}, {landmark['y']:3d}, {landmark['z']:6.3f})")
+                            landmark = landmarks[idx]
+                            lines.append(f"    {idx:2d}-{landmark['name']}: ({landmark['x']:3d}, {landmark['y']:3d}, {landmark['z']:6.3f})")
+                print('\n'.join(lines))
             
             # Display
             cv2.imshow('Optimized Hand Detection', final_frame)
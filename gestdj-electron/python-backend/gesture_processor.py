@@ -1,16 +1,161 @@
 #!/usr/bin/env python3
 """
 Gesture Processor - Receives landmarks from Electron, outputs MIDI
-Reads landmark JSON from stdin, processes gestures, sends MIDI to Mixxx
+Reads landmark frames (binary floats, or JSON with a flat 63-float array per hand) from stdin,
+processes gestures, sends MIDI to Mixxx
+With --shm, landmarks are instead read from a shared memory-mapped file written by Electron
 """
 
+import os
 import sys
 import json
 import math
+import mmap
 import time
+import signal
+import struct
+import tempfile
+import threading
+import numpy as np
 from utils.midi_virtual_device import VirtualMIDIDevice
 
+# Optional: orjson for fast (de)serialization of the per-frame messages
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+    JSONDecodeError = orjson.JSONDecodeError
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+    def json_loads(data):
+        """Parse a bytes-like payload, matching orjson.loads"""
+        return json.loads(bytes(data))
+
+    # json.dumps builds a new encoder whenever non-default options are passed; build the compact one once
+    _json_encode = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+    def json_dumps(obj):
+        """Serialize to UTF-8 bytes, matching orjson.dumps"""
+        return _json_encode(obj).encode('utf-8')
+
+# Each inbound frame is a little-endian uint32 byte length followed by the payload: JSON if it
+# starts with '{', otherwise binary (uint32 hand mask, then 63 float32 or float16 values per set bit, Left first)
+FRAME_HEADER = struct.Struct('<I')
+
+# Shared landmark block: uint32 seq (odd while Electron is writing), uint32 hand mask
+# (bit 0 = Left, bit 1 = Right), then 2 hands x 21 landmarks x (x, y, z) float32, little-endian
+SHM_HEADER = struct.Struct('<II')
+SHM_HAND_FLOATS = 21 * 3
+SHM_SIZE = SHM_HEADER.size + 2 * SHM_HAND_FLOATS * 4
+
+# Knob sweep in centidegrees (-135° to +135°) and the fixed-point shift for angle -> CC
+ANGLE_SPAN_CD = 27000
+CC_SHIFT = 20
+
+# Optional: numba JIT for the per-hand geometry kernel
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def _fast_atan2_deg(y, x):
+    """Polynomial atan2 in degrees (max error ~0.6°, well under one CC step of ~2.1°)"""
+    a = abs(y)
+    if x >= 0.0:
+        if x + a == 0.0:
+            return 0.0
+        r = (x - a) / (x + a)
+        base = math.pi / 4
+    else:
+        r = (x + a) / (a - x)
+        base = 3 * math.pi / 4
+    deg = ((0.1963 * r * r - 0.9817) * r + base) * (180.0 / math.pi)
+    return -deg if y < 0.0 else deg
+
+
+# Per-joint straightness bound: cos(35° / 2), squared for the sqrt-free comparison
+_COS_JOINT = math.cos(math.radians(35 / 2))
+_COS_JOINT_SQ = _COS_JOINT * _COS_JOINT
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def _compute_hand_features(lm):
+    """
+    Extended-finger bitmask and pointer angle for one (21, 3) landmark array.
+    Bit 0=thumb (never set), 1=index, 2=middle, 3=ring, 4=pinky.
+    Returns (flags_bitmask, angle_deg) with the angle clamped to -135...+135.
+    """
+    wx = lm[0, 0]
+    wy = lm[0, 1]
+    mask = 0
+
+    for f in range(4):
+        base = 5 + 4 * f  # MCP, PIP, DIP, TIP follow consecutively
+
+        # Each joint angle at PIP and DIP must be under half the 35° curvature budget.
+        # cos(angle) >= t  <=>  dot >= 0 and dot^2 >= t^2 * |a|^2 * |b|^2 (no acos/sqrt)
+        joints_ok = True
+        for j in range(1, 3):
+            ax = lm[base + j - 1, 0] - lm[base + j, 0]
+            ay = lm[base + j - 1, 1] - lm[base + j, 1]
+            bx = lm[base + j + 1, 0] - lm[base + j, 0]
+            by = lm[base + j + 1, 1] - lm[base + j, 1]
+            mag1_sq = ax * ax + ay * ay
+            mag2_sq = bx * bx + by * by
+            if mag1_sq < 1e-12 or mag2_sq < 1e-12:
+                continue
+            dot = ax * bx + ay * by
+            if dot < 0.0 or dot * dot < _COS_JOINT_SQ * mag1_sq * mag2_sq:
+                joints_ok = False
+                break
+
+        # Radial monotonicity (landmarks getting farther from wrist); squared distance keeps order
+        radial_ok = True
+        prev_dist = -1.0
+        for j in range(4):
+            dx = lm[base + j, 0] - wx
+            dy = lm[base + j, 1] - wy
+            dist = dx * dx + dy * dy
+            if dist < prev_dist:
+                radial_ok = False
+                break
+            prev_dist = dist
+
+        if joints_ok and radial_ok:
+            mask |= 1 << (f + 1)
+
+    # Wrist to index tip; -dx for proper orientation
+    angle_deg = _fast_atan2_deg(-(lm[8, 0] - wx), lm[8, 1] - wy)
+    angle_deg = max(-135.0, min(135.0, angle_deg))
+
+    return mask, angle_deg
+
+
 class GestureProcessor:
+    # Finger order matches bits 1-4 of the _compute_hand_features mask
+    FINGER_NAMES = ('index', 'middle', 'ring', 'pinky')
+    INDEX_BIT = 1 << 1
+    # Extended-finger mask -> control type by finger count (index only = filter .. all four = high);
+    # None unless the index finger is up. Bit 0 (thumb) is never set by the kernel.
+    CONTROL_FROM_MASK = tuple(
+        (None, 'filter', 'low', 'mid', 'high')[bin(m >> 1).count('1')] if m & 0b10 else None
+        for m in range(32)
+    )
+
     def __init__(self):
         # Initialize MIDI device
         self.midi_device = VirtualMIDIDevice("AI_DJ_Gestures")
@@ -40,63 +185,53 @@ class GestureProcessor:
 
         self.knob_max_angle = 135  # -135° to +135° range
 
+        # Fixed-point angle -> CC mapping per control, over angle_cd = centidegrees + 13500 (0...27000).
+        # Piecewise around the EQ default to match VirtualMIDIDevice.value_to_midi:
+        # cc = (angle_cd * lo_scale) >> 20 below the knee, else hi_base + ((angle_cd - knee) * hi_scale) >> 20
+        self._cc_fixed = {}
+        for control, param in self.knob_params.items():
+            if control in ('low', 'mid', 'high'):
+                knee = round(ANGLE_SPAN_CD * (param['default'] - param['min']) / param['range'])
+                self._cc_fixed[control] = (knee, (63 << CC_SHIFT) // knee,
+                                           64, (63 << CC_SHIFT) // (ANGLE_SPAN_CD - knee))
+            else:
+                self._cc_fixed[control] = (ANGLE_SPAN_CD, (127 << CC_SHIFT) // ANGLE_SPAN_CD, 127, 0)
+
+        # Last [CC byte, emit time] per deck and control, to skip redundant emits (mutated in place)
+        self._last_emit = {d: {c: [-1, 0] for c in self.knob_params} for d in (1, 2)}
+        self.emit_keepalive_ns = 250_000_000  # resend an unchanged CC at most every 250 ms
+
+        # Serialized gesture_update lines for the current frame, written in one flush
+        self._pending_updates = []
+        # Pre-serialized gesture_update per deck and control; only fingers, value and angle are filled per emit
+        self._update_tmpl = {
+            deck: {
+                control: b'{"type":"gesture_update","deck":%d,"fingers":%%d,"gesture":"%s","value":%%r,"angle":%%r}'
+                % (deck, control.encode())
+                for control in self.knob_params
+            }
+            for deck in self.deck_state
+        }
+
+        # Memory-mapped landmark block (--shm mode only)
+        self._shm = None
+        self._shm_path = None
+        self._shm_hands = None
+
+        # Warm up the geometry kernel so JIT compilation doesn't land on the first frame
+        _compute_hand_features(np.zeros((21, 3), dtype=np.float32))
+
     def get_extended_finger_flags(self, landmarks):
         """
         Determine which fingers are extended using curvature analysis.
-        landmarks: list of {'x': norm_x, 'y': norm_y, 'z': norm_z}
+        landmarks: (21, 3) float32 array of normalized x, y, z
         """
         flags = {'thumb': False, 'index': False, 'middle': False, 'ring': False, 'pinky': False}
 
         try:
-            # Finger definitions (landmark indices)
-            fingers = {
-                'index':  [5, 6, 7, 8],
-                'middle': [9, 10, 11, 12],
-                'ring':   [13, 14, 15, 16],
-                'pinky':  [17, 18, 19, 20]
-            }
-
-            wrist = landmarks[0]
-
-            for finger_name, indices in fingers.items():
-                # Get landmarks for this finger
-                mcp = landmarks[indices[0]]
-                pip = landmarks[indices[1]]
-                dip = landmarks[indices[2]]
-                tip = landmarks[indices[3]]
-
-                # Calculate curvature (sum of bend angles)
-                def angle_between_3_points(p1, p2, p3):
-                    """Calculate angle at p2"""
-                    v1 = {'x': p1['x'] - p2['x'], 'y': p1['y'] - p2['y']}
-                    v2 = {'x': p3['x'] - p2['x'], 'y': p3['y'] - p2['y']}
-
-                    dot = v1['x'] * v2['x'] + v1['y'] * v2['y']
-                    mag1 = math.sqrt(v1['x']**2 + v1['y']**2)
-                    mag2 = math.sqrt(v2['x']**2 + v2['y']**2)
-
-                    if mag1 < 1e-6 or mag2 < 1e-6:
-                        return 0.0
-
-                    cos_angle = dot / (mag1 * mag2)
-                    cos_angle = max(-1.0, min(1.0, cos_angle))
-                    return math.degrees(math.acos(cos_angle))
-
-                angle1 = angle_between_3_points(mcp, pip, dip)
-                angle2 = angle_between_3_points(pip, dip, tip)
-                total_curvature = angle1 + angle2
-
-                # Check radial monotonicity (landmarks getting farther from wrist)
-                dist_mcp = math.sqrt((mcp['x'] - wrist['x'])**2 + (mcp['y'] - wrist['y'])**2)
-                dist_pip = math.sqrt((pip['x'] - wrist['x'])**2 + (pip['y'] - wrist['y'])**2)
-                dist_dip = math.sqrt((dip['x'] - wrist['x'])**2 + (dip['y'] - wrist['y'])**2)
-                dist_tip = math.sqrt((tip['x'] - wrist['x'])**2 + (tip['y'] - wrist['y'])**2)
-
-                radial_ok = (dist_mcp <= dist_pip <= dist_dip <= dist_tip)
-
-                # Extended if low curvature and proper radial ordering
-                if total_curvature < 35 and radial_ok:
-                    flags[finger_name] = True
+            mask, _ = _compute_hand_features(landmarks)
+            for bit, finger_name in enumerate(self.FINGER_NAMES, start=1):
+                flags[finger_name] = bool(mask >> bit & 1)
 
         except Exception as e:
             print(f"Error in finger detection: {e}", flush=True)
@@ -109,45 +244,34 @@ class GestureProcessor:
         Returns angle in degrees (-135 to +135 range for knob control).
         """
         try:
-            wrist = landmarks[0]
-            index_tip = landmarks[8]
-
-            dx = index_tip['x'] - wrist['x']
-            dy = index_tip['y'] - wrist['y']
-
-            # atan2 returns -π to π, convert to degrees
-            angle_rad = math.atan2(-dx, dy)  # Note: -dx for proper orientation
-            angle_deg = math.degrees(angle_rad)
-
-            # Map to -135 to +135 range
-            angle_deg = max(-135, min(135, angle_deg))
-
+            _, angle_deg = _compute_hand_features(landmarks)
             return angle_deg
 
         except Exception as e:
             print(f"Error calculating angle: {e}", flush=True)
             return 0.0
 
+    def angle_to_cc(self, control_type, angle):
+        """Map a -135...+135 degree angle to the control's 0-127 CC value in integer fixed point"""
+        angle_cd = min(max(int(round(angle * 100)), -13500), 13500) + 13500
+        knee, lo_scale, hi_base, hi_scale = self._cc_fixed[control_type]
+        if angle_cd < knee:
+            cc = (angle_cd * lo_scale) >> CC_SHIFT
+        else:
+            cc = hi_base + (((angle_cd - knee) * hi_scale) >> CC_SHIFT)
+        return min(cc, 127)
+
     def process_hand(self, landmarks, deck):
         """Process gestures for one hand"""
         try:
-            # Get extended finger flags
-            flags = self.get_extended_finger_flags(landmarks)
-            finger_count = sum([flags['index'], flags['middle'], flags['ring'], flags['pinky']])
-
-            # Map finger count to control type
-            control_map = {
-                1: 'filter',  # Index only
-                2: 'low',     # Index + Middle
-                3: 'mid',     # Index + Middle + Ring
-                4: 'high'     # All four fingers
-            }
+            # Extended finger bitmask and pointer angle in one pass
+            mask, angle = _compute_hand_features(landmarks)
+            finger_count = bin(mask).count('1')
 
+            control_type = self.CONTROL_FROM_MASK[mask]
             state = self.deck_state[deck]
 
-            if finger_count in control_map and flags['index']:  # Require index finger
-                control_type = control_map[finger_count]
-                angle = self.calculate_pointer_angle(landmarks)
+            if control_type:  # Index finger up with 1-4 fingers extended
 
                 # Map angle to knob value (0.0 to 1.0 for filter, 0.0 to 4.0 for EQ)
                 normalized_angle = (angle + 135) / 270  # Map -135...+135 to 0...1
@@ -161,23 +285,33 @@ class GestureProcessor:
                 state['active_knob'] = control_type
                 state['previous_angle'] = angle
 
+                # Skip if the quantized CC byte is unchanged and smoothing has settled on it;
+                # past the keep-alive period, force one resend instead
+                last = self._last_emit[deck][control_type]
+                cc = self.angle_to_cc(control_type, angle)
+                now = time.monotonic_ns()
+                keepalive = now - last[1] >= self.emit_keepalive_ns
+                if cc == last[0] and not keepalive and self.midi_device.is_cc_settled(deck, control_type, cc):
+                    return
+                last[0] = cc
+                last[1] = now
+
                 # Send MIDI
-                self.midi_device.update_control_on_channel(control_type, value, deck)
+                self.midi_device.send_cc_raw(deck, control_type, cc, force_send=keepalive)
 
                 # Output gesture state to stdout (for Electron UI)
-                gesture_update = {
-                    'type': 'gesture_update',
-                    'deck': deck,
-                    'fingers': finger_count,
-                    'gesture': control_type,
-                    'value': round(value, 3),
-                    'angle': round(angle, 1)
-                }
-                print(json.dumps(gesture_update), flush=True)
+                self._pending_updates.append(
+                    self._update_tmpl[deck][control_type] % (finger_count, round(value, 3), round(angle, 1))
+                )
 
         except Exception as e:
             print(f"Error processing hand: {e}", flush=True)
 
+    @staticmethod
+    def landmarks_to_array(landmarks):
+        """Reshape a flat [x0, y0, z0, x1, ...] list of 63 floats into a (21, 3) float32 array"""
+        return np.asarray(landmarks, dtype=np.float32).reshape(21, 3)
+
     def process_landmarks(self, landmark_data):
         """Process landmark data from JavaScript"""
         try:
@@ -185,39 +319,174 @@ class GestureProcessor:
 
             # Process Left hand (Deck 1)
             if 'Left' in hands:
-                self.process_hand(hands['Left'], deck=1)
+                self.process_hand(self.landmarks_to_array(hands['Left']), deck=1)
 
             # Process Right hand (Deck 2)
             if 'Right' in hands:
-                self.process_hand(hands['Right'], deck=2)
+                self.process_hand(self.landmarks_to_array(hands['Right']), deck=2)
+
+            self.flush_updates()
 
         except Exception as e:
             print(f"Error processing landmarks: {e}", flush=True)
 
-    def run(self):
-        """Main loop: read landmarks from stdin"""
-        print("✓ Gesture processor ready, waiting for landmarks...", flush=True)
+    def process_binary_landmarks(self, payload):
+        """Process a binary landmark frame; the float width is implied by the payload length"""
+        (mask,) = FRAME_HEADER.unpack_from(payload)
+        mask &= 3
+        n_hands = bin(mask).count('1')
+        body = payload[FRAME_HEADER.size:]
+        if len(body) == n_hands * SHM_HAND_FLOATS * 2:
+            hands = np.frombuffer(body, dtype='<f2').reshape(n_hands, 21, 3).astype(np.float32)
+        else:
+            hands = np.frombuffer(body, dtype='<f4', count=n_hands * SHM_HAND_FLOATS).reshape(n_hands, 21, 3)
 
         try:
-            for line in sys.stdin:
-                try:
-                    data = json.loads(line.strip())
-
-                    if data.get('type') == 'landmarks':
-                        self.process_landmarks(data)
+            if mask & 1:
+                self.process_hand(hands[0], deck=1)
+            if mask & 2:
+                self.process_hand(hands[n_hands - 1], deck=2)
+            self.flush_updates()
+        except Exception as e:
+            print(f"Error processing landmarks: {e}", flush=True)
 
-                except json.JSONDecodeError:
-                    # Skip malformed JSON
+    @staticmethod
+    def _read_exact(stream, view):
+        """Fill view from stream; returns False on EOF"""
+        filled = 0
+        while filled < len(view):
+            n = stream.readinto(view[filled:])
+            if not n:
+                return False
+            filled += n
+        return True
+
+    def flush_updates(self):
+        """Write this frame's gesture_update lines to stdout in a single write + flush"""
+        if not self._pending_updates:
+            return
+        out = sys.stdout.buffer
+        out.write(b'\n'.join(self._pending_updates) + b'\n')
+        out.flush()
+        self._pending_updates.clear()
+
+    def _open_shared_landmarks(self):
+        """Create the memory-mapped landmark block; returns its path, or None to stay on stdin"""
+        try:
+            fd, path = tempfile.mkstemp(prefix='gestedj_landmarks_', suffix='.bin')
+            os.ftruncate(fd, SHM_SIZE)
+            self._shm = mmap.mmap(fd, SHM_SIZE)
+            os.close(fd)
+            self._shm_path = path
+            self._shm_hands = np.frombuffer(self._shm, dtype=np.float32, count=2 * SHM_HAND_FLOATS,
+                                            offset=SHM_HEADER.size).reshape(2, 21, 3)
+            return path
+        except Exception as e:
+            print(f"Shared landmark memory unavailable, using stdin: {e}", flush=True)
+            self._close_shared_landmarks()
+            return None
+
+    def _close_shared_landmarks(self):
+        """Release and remove the memory-mapped landmark block"""
+        shm, path = self._shm, self._shm_path
+        self._shm_hands = None
+        self._shm = None
+        self._shm_path = None
+        if shm is not None:
+            shm.close()
+        if path is not None and os.path.exists(path):
+            os.unlink(path)
+
+    def _run_shared(self):
+        """Poll the shared landmark block (seqlock) until stdin closes"""
+        # Electron keeps stdin open for the life of the backend; EOF means it went away
+        stdin_closed = threading.Event()
+
+        def watch_stdin():
+            while sys.stdin.buffer.read(4096):
+                pass
+            stdin_closed.set()
+
+        threading.Thread(target=watch_stdin, daemon=True).start()
+
+        hands = np.empty((2, 21, 3), dtype=np.float32)
+        last_seq = 0
+        while not stdin_closed.is_set():
+            seq, mask = SHM_HEADER.unpack_from(self._shm, 0)
+            if seq == last_seq or seq & 1:
+                time.sleep(0.001)
+                continue
+
+            np.copyto(hands, self._shm_hands)
+            if SHM_HEADER.unpack_from(self._shm, 0)[0] != seq:
+                continue  # Torn read; Electron wrote mid-copy
+            last_seq = seq
+
+            try:
+                if mask & 1:
+                    self.process_hand(hands[0], deck=1)
+                if mask & 2:
+                    self.process_hand(hands[1], deck=2)
+                self.flush_updates()
+            except Exception as e:
+                print(f"Error processing landmarks: {e}", flush=True)
+
+    def _run_stdin(self):
+        """Read length-prefixed landmark frames from stdin until EOF"""
+        stdin = sys.stdin.buffer
+        header = bytearray(FRAME_HEADER.size)
+        buf = bytearray(65536)
+
+        while self._read_exact(stdin, memoryview(header)):
+            (n,) = FRAME_HEADER.unpack_from(header)
+            if n > len(buf):
+                buf = bytearray(max(n, 2 * len(buf)))
+            payload = memoryview(buf)[:n]
+            if not self._read_exact(stdin, payload):
+                break
+
+            try:
+                if payload[:1] != b'{':
+                    self.process_binary_landmarks(payload)
                     continue
-                except Exception as e:
-                    print(f"Error processing line: {e}", flush=True)
+
+                data = json_loads(payload)
+
+                if data.get('type') == 'landmarks':
+                    self.process_landmarks(data)
+
+            except JSONDecodeError:
+                # Skip malformed JSON
+                continue
+            except Exception as e:
+                print(f"Error processing frame: {e}", flush=True)
+
+    def run(self, use_shared_memory=False):
+        """Main loop: read landmarks from shared memory if requested and available, else stdin"""
+        shm_path = self._open_shared_landmarks() if use_shared_memory else None
+        if shm_path:
+            # Tell Electron where to write; it switches off stdin framing when it sees this
+            sys.stdout.buffer.write(json_dumps({'type': 'shm_ready', 'path': shm_path, 'size': SHM_SIZE}) + b'\n')
+            sys.stdout.buffer.flush()
+
+        print("✓ Gesture processor ready, waiting for landmarks...", flush=True)
+
+        # Electron stops the backend with SIGTERM; unwind through finally so the mapped file is removed
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+        try:
+            if shm_path:
+                self._run_shared()
+            else:
+                self._run_stdin()
 
         except KeyboardInterrupt:
             print("\n✓ Shutting down gesture processor", flush=True)
         finally:
+            self._close_shared_landmarks()
             if self.midi_device:
                 self.midi_device.close()
 
 if __name__ == '__main__':
     processor = GestureProcessor()
-    processor.run()
+    processor.run(use_shared_memory='--shm' in sys.argv[1:])
@@ -1,6 +1,7 @@
 const { app, BrowserWindow, ipcMain } = require('electron');
 const { spawn } = require('child_process');
 const { join } = require('path');
+const fs = require('fs');
 const WebSocket = require('ws');
 
 // Keep a global reference of the window object
@@ -8,11 +9,42 @@ let mainWindow;
 let pythonProcess = null;
 let wsServer = null;
 
+// float32 -> IEEE 754 half bits for the stdin landmark frames (normalized coords lose < 3e-4)
+const halfScratch = new Float32Array(1);
+const halfScratchBits = new Uint32Array(halfScratch.buffer);
+
+function toHalfBits(value) {
+  halfScratch[0] = value;
+  const bits = halfScratchBits[0];
+  const sign = (bits >>> 16) & 0x8000;
+  const exp = ((bits >>> 23) & 0xff) - 112;
+  const mant = bits & 0x7fffff;
+  if (exp >= 0x1f) return sign | 0x7c00;            // Overflow (and NaN) -> infinity
+  if (exp <= 0) {
+    if (exp < -10) return sign;                      // Underflow -> signed zero
+    return sign | ((((mant | 0x800000) >> (1 - exp)) + 0x1000) >> 13);
+  }
+  return sign | ((exp << 10) + ((mant + 0x1000) >> 13));  // Rounding may carry into the exponent
+}
+
 // Python backend management
 class PythonBackend {
   constructor() {
     this.process = null;
     this.isRunning = false;
+
+    // Shared landmark block announced by Python ('shm_ready'); null means stdin framing
+    this.shmFd = null;
+    this.shmSeq = 0;
+    this.shmHeader = Buffer.alloc(8);
+    this.shmFloats = new Float32Array(2 * 63);
+    this.shmData = Buffer.from(this.shmFloats.buffer);
+
+    // Incomplete trailing stdout line, completed by the next chunk
+    this.stdoutTail = '';
+
+    // stdin frames skipped because Python had not drained the previous ones
+    this.droppedFrames = 0;
   }
 
   async start() {
@@ -33,7 +65,8 @@ class PythonBackend {
       console.log('Python executable:', pythonExecutable);
       console.log('Working directory:', pythonCwd);
 
-      this.process = spawn(pythonExecutable, [pythonScript], {
+      this.stdoutTail = '';
+      this.process = spawn(pythonExecutable, [pythonScript, '--shm'], {
         stdio: ['pipe', 'pipe', 'pipe'],  // Enable stdin piping
         cwd: pythonCwd
       });
@@ -42,17 +75,18 @@ class PythonBackend {
         const output = data.toString();
         console.log('Python stdout:', output);
 
-        // Try to parse as JSON for gesture updates
-        const lines = output.split('\n');
+        // Drain every complete line in this chunk, then forward only the newest gesture update per deck and control
+        const lines = (this.stdoutTail + output).split('\n');
+        this.stdoutTail = lines.pop();
+        const latestByControl = new Map();
         lines.forEach(line => {
           if (line.trim()) {
             try {
               const parsed = JSON.parse(line);
-              if (parsed.type === 'gesture_update') {
-                // Send gesture update to renderer
-                if (mainWindow) {
-                  mainWindow.webContents.send('gesture-update', parsed);
-                }
+              if (parsed.type === 'shm_ready') {
+                this.attachSharedLandmarks(parsed.path);
+              } else if (parsed.type === 'gesture_update') {
+                latestByControl.set(`${parsed.deck}:${parsed.gesture}`, parsed);
               }
             } catch (e) {
               // Not JSON, send as regular log
@@ -62,6 +96,11 @@ class PythonBackend {
             }
           }
         });
+
+        // Send gesture updates to renderer (older ones in the same chunk are already stale)
+        if (mainWindow) {
+          latestByControl.forEach(update => mainWindow.webContents.send('gesture-update', update));
+        }
       });
 
       this.process.stderr.on('data', (data) => {
@@ -74,6 +113,7 @@ class PythonBackend {
       this.process.on('close', (code) => {
         console.log(`Python process exited with code ${code}`);
         this.isRunning = false;
+        this.detachSharedLandmarks();
         if (mainWindow) {
           mainWindow.webContents.send('python-status', 'stopped');
         }
@@ -91,6 +131,9 @@ class PythonBackend {
     if (this.process && this.isRunning) {
       this.process.kill('SIGTERM');
       this.isRunning = false;
+      if (this.droppedFrames > 0) {
+        console.log(`Dropped ${this.droppedFrames} landmark frames while Python was busy`);
+      }
       return 'Python backend stopped';
     }
     return 'Backend was not running';
@@ -99,6 +142,72 @@ class PythonBackend {
   getStatus() {
     return this.isRunning ? 'running' : 'stopped';
   }
+
+  attachSharedLandmarks(path) {
+    try {
+      this.shmFd = fs.openSync(path, 'r+');
+      this.shmSeq = 0;
+      console.log('Writing landmarks to shared memory:', path);
+    } catch (error) {
+      console.error('Failed to open shared landmark memory, staying on stdin:', error);
+      this.shmFd = null;
+    }
+  }
+
+  detachSharedLandmarks() {
+    if (this.shmFd !== null) {
+      try {
+        fs.closeSync(this.shmFd);
+      } catch (error) {
+        // Python already removed the file
+      }
+      this.shmFd = null;
+    }
+  }
+
+  sendLandmarks(landmarkData) {
+    if (this.shmFd !== null) {
+      // Seqlock: odd seq while writing, even once the hand data is complete
+      const hands = landmarkData.hands || {};
+      let mask = 0;
+      if (hands.Left) { this.shmFloats.set(hands.Left, 0); mask |= 1; }
+      if (hands.Right) { this.shmFloats.set(hands.Right, 63); mask |= 2; }
+
+      this.shmHeader.writeUInt32LE((this.shmSeq += 1) >>> 0, 0);
+      this.shmHeader.writeUInt32LE(mask, 4);
+      fs.writeSync(this.shmFd, this.shmHeader, 0, 8, 0);
+      fs.writeSync(this.shmFd, this.shmData, 0, this.shmData.length, 8);
+      this.shmHeader.writeUInt32LE((this.shmSeq += 1) >>> 0, 0);
+      fs.writeSync(this.shmFd, this.shmHeader, 0, 4, 0);
+      return;
+    }
+
+    // Latest wins: while the pipe is backed up, drop whole frames instead of queueing stale landmarks
+    if (this.process.stdin.writableNeedDrain) {
+      this.droppedFrames += 1;
+      return;
+    }
+
+    // Length-prefixed binary frame: uint32 LE byte count, uint32 hand mask, then 63 float16 per hand (Left first)
+    const hands = landmarkData.hands || {};
+    const present = [hands.Left, hands.Right];
+    let mask = 0;
+    let count = 0;
+    present.forEach((hand, i) => { if (hand) { mask |= 1 << i; count += 1; } });
+
+    const frame = Buffer.alloc(8 + count * 63 * 2);
+    frame.writeUInt32LE(frame.length - 4, 0);
+    frame.writeUInt32LE(mask, 4);
+    let offset = 8;
+    present.forEach((hand) => {
+      if (!hand) return;
+      for (let i = 0; i < 63; i++) {
+        frame.writeUInt16LE(toHalfBits(hand[i]), offset);
+        offset += 2;
+      }
+    });
+    this.process.stdin.write(frame);
+  }
 }
 
 const pythonBackend = new PythonBackend();
@@ -203,12 +312,12 @@ ipcMain.handle('test-websocket-connection', async () => {
 
 // Handle landmark data from renderer
 ipcMain.on('landmarks', (event, landmarkData) => {
-  // Send to Python stdin
+  // Send to Python (shared landmark memory if attached, else stdin)
   if (pythonBackend.process && pythonBackend.isRunning) {
     try {
-      pythonBackend.process.stdin.write(JSON.stringify(landmarkData) + '\n');
+      pythonBackend.sendLandmarks(landmarkData);
     } catch (error) {
-      console.error('Failed to write to Python stdin:', error);
+      console.error('Failed to send landmarks to Python:', error);
     }
   }
 });
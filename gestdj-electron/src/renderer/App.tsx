@@ -136,10 +136,17 @@ function App() {
               hands: {}
             };
 
-            // Map each detected hand to Left/Right
+            // Map each detected hand to Left/Right as a flat [x0, y0, z0, x1, ...] array (63 floats)
             for (let i = 0; i < results.landmarks.length; i++) {
               const handedness = results.handedness[i][0].categoryName;
-              landmarkData.hands[handedness] = results.landmarks[i];
+              const hand = results.landmarks[i];
+              const flat = new Array(hand.length * 3);
+              for (let j = 0; j < hand.length; j++) {
+                flat[3 * j] = hand[j].x;
+                flat[3 * j + 1] = hand[j].y;
+                flat[3 * j + 2] = hand[j].z;
+              }
+              landmarkData.hands[handedness] = flat;
             }
 
             // Send to main process
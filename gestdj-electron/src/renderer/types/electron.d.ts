@@ -3,9 +3,10 @@
 interface LandmarkData {
   type: 'landmarks';
   timestamp: number;
+  // Flat [x0, y0, z0, x1, y1, z1, ...] per hand (21 landmarks x 3 = 63 floats)
   hands: {
-    Left?: Array<{ x: number; y: number; z: number }>;
-    Right?: Array<{ x: number; y: number; z: number }>;
+    Left?: number[];
+    Right?: number[];
   };
 }
 
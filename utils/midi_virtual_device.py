@@ -60,6 +60,8 @@ class VirtualMIDIDevice:
         }
         # Per-channel smoothing to prevent cross-deck coupling
         self.smoothed_values_by_channel = {}
+        # Per-channel smoothing state for pre-quantized CC bytes, in 1/256 CC steps
+        self.smoothed_cc_by_channel = {}
         
         # Per-channel last-sent tracking (used for multi-deck updates)
         self.last_sent_values_by_channel = {}
@@ -244,6 +246,26 @@ class VirtualMIDIDevice:
         channel_map[control_name] = smoothed
         return smoothed
     
+    def apply_cc_smoothing_on_channel(self, control_name: str, midi_value: int, channel: int) -> int:
+        """Integer counterpart of apply_smoothing_on_channel for 0-127 CC bytes."""
+        if channel not in self.smoothed_cc_by_channel:
+            self.smoothed_cc_by_channel[channel] = {}
+        channel_map = self.smoothed_cc_by_channel[channel]
+        target = midi_value << 8
+        if control_name not in channel_map:
+            channel_map[control_name] = target
+            return midi_value
+        # Same exponential smoothing as the float path, with the factor in 1/256 steps
+        alpha = round(self.smoothing_factor * 256)
+        smoothed = (alpha * channel_map[control_name] + (256 - alpha) * target) >> 8
+        channel_map[control_name] = smoothed
+        return (smoothed + 128) >> 8
+    
+    def is_cc_settled(self, deck: int, control_name: str, midi_value: int) -> bool:
+        """True once the smoothed CC for a control on a deck has caught up with midi_value."""
+        state = self.smoothed_cc_by_channel.get(deck, {}).get(control_name)
+        return state is not None and (state + 128) >> 8 == midi_value
+    
     def update_control(self, control_name: str, value: float, force_send: bool = False):
         """
         Update a specific control with gesture data
@@ -311,6 +333,33 @@ class VirtualMIDIDevice:
             self.last_sent_values_by_channel[deck][control_name] = midi_value
             return True
         return False
+    
+    def send_cc_raw(self, deck: int, control_name: str, midi_value: int, force_send: bool = False):
+        """
+        Send an already-quantized 0-127 value for a control on a deck's channel.
+        Skips value_to_midi; keeps per-deck smoothing and the "changed by at least 2" filter.
+        """
+        config = self.midi_control_config.get(control_name)
+        if config is None:
+            return False
+        
+        # Apply per-deck smoothing on the CC byte
+        midi_value = self.apply_cc_smoothing_on_channel(control_name, midi_value, deck)
+        
+        if deck not in self.last_sent_values_by_channel:
+            self.last_sent_values_by_channel[deck] = {}
+        last_value = self.last_sent_values_by_channel[deck].get(control_name)
+        
+        if not force_send and last_value is not None:
+            if abs(midi_value - last_value) < 2:
+                return False
+        
+        cc_number = config['cc2'] if deck == 2 else config['cc1']
+        success = self.send_control_change(deck - 1, cc_number, midi_value)
+        if success:
+            self.last_sent_values_by_channel[deck][control_name] = midi_value
+            return True
+        return False
 
 
 